@@ -1,6 +1,69 @@
 #!/usr/bin/env python
+import functools
 import platform
+import re
 import subprocess
+import sys
+
+# Matches e.g. "LMP Version: 5.0 (0x9)  Subversion: 0x1234" in `hciconfig -a` output
+_LMP_RE = re.compile(rb"LMP Version.*?\(0x([0-9a-fA-F]+)\)")
+
+# Minimal environment for hciconfig; the C locale keeps its output parse-stable
+_HCICONFIG_ENV = {"PATH": "/usr/sbin:/usr/bin:/sbin:/bin", "LC_ALL": "C"}
+
+# Bluetooth Core Specification version indexed by LMP Version number.
+# This table is based on the official Bluetooth SIG assigned numbers.
+_LMP_TABLE = (
+    "1.0b",  # 0x0
+    "1.1",  # 0x1
+    "1.2",  # 0x2
+    "2.0 + EDR",  # 0x3
+    "2.1 + EDR",  # 0x4
+    "3.0 + HS",  # 0x5
+    "4.0",  # 0x6
+    "4.1",  # 0x7
+    "4.2",  # 0x8
+    "5.0",  # 0x9
+    "5.1",  # 0xa
+    "5.2",  # 0xb
+    "5.3",  # 0xc
+    "5.4",  # 0xd
+    # Add more entries as new Bluetooth versions are released
+)
+
+_LMP_TABLE_LINES = tuple(
+    f"   LMP Version 0x{lmp:x} = Bluetooth {bt_version}"
+    for lmp, bt_version in enumerate(_LMP_TABLE)
+)
+
+
+def _emit(*lines: str) -> None:
+    """Write a block of output lines to stdout with a single write and flush."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+@functools.lru_cache(maxsize=1)
+def _probe_lmp_version() -> int | None:
+    """Return the adapter's LMP version number from `hciconfig -a`, or None.
+
+    The result is cached so repeated calls do not re-spawn hciconfig; call
+    clear_cache() after an adapter change.
+    """
+    # Run hciconfig -a to get detailed information about Bluetooth adapters
+    # This command might require root privileges (sudo)
+    process = subprocess.run(
+        ["hciconfig", "-a"],
+        capture_output=True,
+        check=True,
+        env=_HCICONFIG_ENV,
+        # Python-created fds are non-inheritable (PEP 446), so skip the fd sweep
+        close_fds=False,
+    )
+
+    # Single pass over the raw bytes for the "LMP Version ... (0x..)" token
+    match = _LMP_RE.search(process.stdout)
+    return int(match.group(1), 16) if match else None
 
 
 def get_bluetooth_protocol_version():
@@ -11,151 +74,92 @@ def get_bluetooth_protocol_version():
     """
     system = platform.system()
 
-    # Define the mapping from LMP Version (hex) to Bluetooth Core Specification Version
-    # This table is based on the official Bluetooth SIG assigned numbers.
-    lmp_to_bluetooth_version = {
-        "0x0": "1.0b",
-        "0x1": "1.1",
-        "0x2": "1.2",
-        "0x3": "2.0 + EDR",
-        "0x4": "2.1 + EDR",
-        "0x5": "3.0 + HS",
-        "0x6": "4.0",
-        "0x7": "4.1",
-        "0x8": "4.2",
-        "0x9": "5.0",
-        "0xa": "5.1",
-        "0xb": "5.2",
-        "0xc": "5.3",
-        "0xd": "5.4",
-        # Add more mappings as new Bluetooth versions are released
-    }
-
     if system == "Linux":
-        print("Attempting to retrieve Bluetooth adapter information on Linux...")
+        _emit("Attempting to retrieve Bluetooth adapter information on Linux...")
         try:
-            # Run hciconfig -a to get detailed information about Bluetooth adapters
-            # This command might require root privileges (sudo)
-            process = subprocess.run(
-                ["hciconfig", "-a"], capture_output=True, text=True, check=True
-            )
-            output = process.stdout
+            lmp = _probe_lmp_version()
 
-            # Look for "LMP Version" in the output
-            lmp_version_line = next(
-                (line for line in output.splitlines() if "LMP Version" in line), None
-            )
+            if lmp is not None:
+                bluetooth_version = (
+                    _LMP_TABLE[lmp] if 0 <= lmp < len(_LMP_TABLE) else "Unknown"
+                )
 
-            if lmp_version_line:
-                # Find the start of the hex value (e.g., "0x")
-                hex_start = lmp_version_line.find("0x")
-                if hex_start != -1:
-                    # Find the end of the hex value (the character just before
-                    # the closing parenthesis)
-                    hex_end = lmp_version_line.find(")", hex_start)
-                    if hex_end != -1:
-                        # Extract the hex value, convert to lowercase for
-                        # consistent dictionary lookup
-                        lmp_hex_version = (
-                            lmp_version_line[hex_start:hex_end].strip().lower()
-                        )
-
-                        bluetooth_version = lmp_to_bluetooth_version.get(
-                            lmp_hex_version, "Unknown"
-                        )
-
-                        print(f"\nFound LMP Version: {lmp_hex_version}")
-                        print(
-                            "This translates to Bluetooth Core Specification:"
-                            f" {bluetooth_version}"
-                        )
-                        print(
-                            "This is based on the Link Manager Protocol (LMP) version"
-                            " reported by your adapter."
-                        )
-                    else:
-                        print(
-                            "\nCould not find closing parenthesis for LMP Version"
-                            " (hex)."
-                        )
-                        print("Raw LMP Version line:", lmp_version_line)
-                else:
-                    print("\nCould not find '0x' in LMP Version line.")
-                    print("Raw LMP Version line:", lmp_version_line)
+                _emit(
+                    f"\nFound LMP Version: 0x{lmp:x}",
+                    "This translates to Bluetooth Core Specification:"
+                    f" {bluetooth_version}",
+                    "This is based on the Link Manager Protocol (LMP) version"
+                    " reported by your adapter.",
+                )
             else:
-                print("\n'LMP Version' not found in hciconfig output.")
-                print(
+                _emit(
+                    "\n'LMP Version' not found in hciconfig output.",
                     "This might mean your Bluetooth adapter is not active, or"
-                    " hciconfig output format is different."
-                )
-                print("Ensure your Bluetooth adapter is plugged in and enabled.")
-                print(
+                    " hciconfig output format is different.",
+                    "Ensure your Bluetooth adapter is plugged in and enabled.",
                     "You might need to run this script with `sudo python"
-                    " your_script_name.py`."
+                    " your_script_name.py`.",
                 )
 
         except FileNotFoundError:
-            print("\nError: `hciconfig` command not found.")
-            print("Please ensure `bluez` utilities are installed on your Linux system.")
-            print(
+            _emit(
+                "\nError: `hciconfig` command not found.",
+                "Please ensure `bluez` utilities are installed on your Linux system.",
                 "You can usually install it with: `sudo apt-get install bluez`"
-                " (Debian/Ubuntu) or `sudo yum install bluez` (Fedora/RHEL)."
+                " (Debian/Ubuntu) or `sudo yum install bluez` (Fedora/RHEL).",
             )
         except subprocess.CalledProcessError as e:
-            print(f"\nError running `hciconfig`: {e}")
-            print("This often means you need elevated privileges.")
-            print("Try running the script with `sudo python your_script_name.py`.")
-            print("Stderr:", e.stderr)
+            _emit(
+                f"\nError running `hciconfig`: {e}",
+                "This often means you need elevated privileges.",
+                "Try running the script with `sudo python your_script_name.py`.",
+                "Stderr: " + e.stderr.decode(errors="replace"),
+            )
         except Exception as e:
-            print(f"\nAn unexpected error occurred: {e}")
+            _emit(f"\nAn unexpected error occurred: {e}")
 
     elif system == "Windows":
-        print(
+        _emit(
             "Identifying Bluetooth protocol version on Windows is more complex"
-            " programmatically."
-        )
-        print("You can usually find this information in Device Manager:")
-        print("1. Open Device Manager (search for it in the Start Menu).")
-        print("2. Expand 'Bluetooth' or 'Bluetooth Radios'.")
-        print(
+            " programmatically.",
+            "You can usually find this information in Device Manager:",
+            "1. Open Device Manager (search for it in the Start Menu).",
+            "2. Expand 'Bluetooth' or 'Bluetooth Radios'.",
             "3. Right-click on your Bluetooth adapter (e.g., 'Generic Bluetooth"
-            " Adapter') and select 'Properties'."
-        )
-        print(
+            " Adapter') and select 'Properties'.",
             "4. Go to the 'Advanced' tab. The 'Firmware Version' or 'LMP' (Link"
-            " Manager Protocol) entry often indicates the Bluetooth version."
+            " Manager Protocol) entry often indicates the Bluetooth version.",
+            "\nHere's the LMP to Bluetooth version mapping:",
+            *_LMP_TABLE_LINES,
         )
-        print("\nHere's the LMP to Bluetooth version mapping:")
-        for lmp_hex, bt_version in lmp_to_bluetooth_version.items():
-            print(f"   LMP Version {lmp_hex} = Bluetooth {bt_version}")
 
     elif system == "Darwin":  # macOS
-        print(
+        _emit(
             "Identifying Bluetooth protocol version on macOS is more complex"
-            " programmatically."
-        )
-        print("You can usually find this information in 'System Information':")
-        print(
-            "1. Hold down the Option (Alt) key and click the Apple menu () in the"
-            " top-left corner."
-        )
-        print("2. Select 'System Information'.")
-        print("3. In the left sidebar, under 'Hardware', select 'Bluetooth'.")
-        print(
+            " programmatically.",
+            "You can usually find this information in 'System Information':",
+            "1. Hold down the Option (Alt) key and click the Apple menu () in the"
+            " top-left corner.",
+            "2. Select 'System Information'.",
+            "3. In the left sidebar, under 'Hardware', select 'Bluetooth'.",
             "4. Look for 'LMP Version' or 'Bluetooth Low Energy Supported'. The LMP"
-            " Version will indicate the core specification version."
+            " Version will indicate the core specification version.",
+            "\nHere's the LMP to Bluetooth version mapping:",
+            *_LMP_TABLE_LINES,
         )
-        print("\nHere's the LMP to Bluetooth version mapping:")
-        for lmp_hex, bt_version in lmp_to_bluetooth_version.items():
-            print(f"   LMP Version {lmp_hex} = Bluetooth {bt_version}")
 
     else:
-        print(f"Unsupported operating system: {system}")
-        print(
+        _emit(
+            f"Unsupported operating system: {system}",
             "Please consult your operating system's documentation or system"
-            " information tools to find your Bluetooth adapter's protocol version."
+            " information tools to find your Bluetooth adapter's protocol version.",
         )
 
 
+def clear_cache() -> None:
+    """Forget the cached LMP version, e.g. after the adapter changed."""
+    _probe_lmp_version.cache_clear()
+
+
 if __name__ == "__main__":
     get_bluetooth_protocol_version()
@@ -15,11 +15,18 @@ This daemon implements a complete ESPHome API server with Bluetooth proxy functi
 import argparse
 import asyncio
 import logging
-import os
+import queue
 import signal
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import Optional
+
+try:
+    # Optional faster event loop (pip install esphome-python-bluetooth-proxy[uvloop])
+    import uvloop
+except ImportError:
+    uvloop = None
 
 # Configure system path before imports
 sys.path.insert(0, str(Path(__file__).parent / "src"))
@@ -70,8 +77,14 @@ class ESPHomeBluetoothProxyDaemon:
         self.batch_size = batch_size
 
         self.server = None
+        # server.start() serves until the server stops, so it runs as a task
+        self._serve_task: Optional[asyncio.Task] = None
         self.running = False
         self.logger = None
+        self._log_listener = None
+
+        # Set by shutdown() to wake run_forever(); binds to the loop on first use
+        self._stop_event = asyncio.Event()
 
     def setup_logging(self):
         """Configure logging based on parameters."""
@@ -101,34 +114,39 @@ class ESPHomeBluetoothProxyDaemon:
         # Add file handler if specified
         if self.log_file:
             # Create log directory if it doesn't exist
-            log_dir = os.path.dirname(self.log_file)
-            if log_dir and not os.path.exists(log_dir):
-                os.makedirs(log_dir)
+            log_path = Path(self.log_file)
+            log_path.parent.mkdir(parents=True, exist_ok=True)
 
             # Create rotating file handler (10MB per file, max 5 files)
             file_handler = RotatingFileHandler(
-                self.log_file, maxBytes=10 * 1024 * 1024, backupCount=5
+                str(log_path), maxBytes=10 * 1024 * 1024, backupCount=5
             )
             file_handler.setFormatter(formatter)
             handlers.append(file_handler)
 
-        # Add handlers to logger
-        for handler in handlers:
-            self.logger.addHandler(handler)
+        # Route records through a queue so console/file I/O (including log
+        # rotation) happens on the listener thread, not the event loop
+        log_queue = queue.SimpleQueue()
+        self.logger.addHandler(QueueHandler(log_queue))
+        self._log_listener = QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        self._log_listener.start()
 
         # Log startup information
         self.logger.info("ESPHome Python Bluetooth Proxy Daemon starting")
-        self.logger.info(f"Host: {self.host}, Port: {self.port}")
+        self.logger.info("Host: %s, Port: %s", self.host, self.port)
         self.logger.info(
-            f"Device name: {self.name}, Friendly name: {self.friendly_name}"
+            "Device name: %s, Friendly name: %s", self.name, self.friendly_name
         )
         self.logger.info(
-            f"Active connections: {self.active_connections}, "
-            f"Max connections: {self.max_connections}"
+            "Active connections: %s, Max connections: %s",
+            self.active_connections,
+            self.max_connections,
         )
-        self.logger.info(f"Log level: {self.log_level}")
+        self.logger.info("Log level: %s", self.log_level)
         if self.log_file:
-            self.logger.info(f"Logging to file: {self.log_file}")
+            self.logger.info("Logging to file: %s", self.log_file)
 
     async def start(self):
         """Start the ESPHome API server with Bluetooth proxy."""
@@ -144,39 +162,64 @@ class ESPHomeBluetoothProxyDaemon:
             )
 
             # Configure Bluetooth proxy if needed
-            if hasattr(self.server, "bluetooth_proxy") and self.server.bluetooth_proxy:
-                self.server.bluetooth_proxy.set_max_connections(self.max_connections)
-                self.server.bluetooth_proxy.set_batch_size(self.batch_size)
-
-            # Start server
-            await self.server.start()
+            bluetooth_proxy = getattr(self.server, "bluetooth_proxy", None)
+            if bluetooth_proxy is not None:
+                bluetooth_proxy.set_max_connections(self.max_connections)
+                bluetooth_proxy.set_batch_size(self.batch_size)
+
+            # Start serving in the background and wait until the server listens
+            # (or start() fails, which raises here)
+            self._serve_task = asyncio.create_task(self._serve())
+            started = asyncio.create_task(self.server.started.wait())
+            await asyncio.wait(
+                (self._serve_task, started), return_when=asyncio.FIRST_COMPLETED
+            )
+            if not started.done():
+                started.cancel()
+                self._serve_task.result()
+                raise RuntimeError("Server stopped during startup")
             self.running = True
 
             self.logger.info(
-                f"ESPHome API server started successfully on {self.host}:{self.port}"
+                "ESPHome API server started successfully on %s:%s",
+                self.host,
+                self.port,
             )
             self.logger.info(
-                f"Bluetooth proxy initialized with "
-                f"{self.max_connections} max connections"
+                "Bluetooth proxy initialized with %s max connections",
+                self.max_connections,
             )
 
             # Verify GATT handler integration
-            if self.server.bluetooth_proxy and hasattr(
-                self.server.bluetooth_proxy, "gatt_handler"
-            ):
+            bluetooth_proxy = self.server.bluetooth_proxy
+            gatt_handler = getattr(bluetooth_proxy, "gatt_handler", None)
+            if gatt_handler is not None:
                 self.logger.info("GATT operations handler properly integrated")
 
-                # Get GATT handler stats if available
-                if hasattr(self.server.bluetooth_proxy.gatt_handler, "get_stats"):
-                    stats = self.server.bluetooth_proxy.gatt_handler.get_stats()
-                    self.logger.info(f"GATT handler stats: {stats}")
+                # Get GATT handler stats if available (skipped when INFO is off)
+                if self.logger.isEnabledFor(logging.INFO):
+                    get_stats = getattr(gatt_handler, "get_stats", None)
+                    if get_stats is not None:
+                        self.logger.info("GATT handler stats: %s", get_stats())
 
             return True
 
         except Exception as e:
-            self.logger.error(f"Failed to start server: {e}", exc_info=True)
+            self.logger.error("Failed to start server: %s", e, exc_info=True)
             return False
 
+    async def _serve(self):
+        """Run the server until it stops, reporting sys.exit() as an error.
+
+        A task re-raises SystemExit straight out of the event loop, skipping
+        shutdown and leaving the task's exception unretrieved, so it is turned
+        into an ordinary exception for start() and run_forever() to report.
+        """
+        try:
+            await self.server.start()
+        except SystemExit as e:
+            raise RuntimeError(f"Server exited with status {e.code}") from e
+
     async def run_forever(self):
         """Run the daemon indefinitely until stopped."""
         if not await self.start():
@@ -188,14 +231,20 @@ class ESPHomeBluetoothProxyDaemon:
                 "ESPHome Python Bluetooth Proxy is running. Press Ctrl+C to stop."
             )
 
-            # Keep the daemon running
-            while self.running:
-                await asyncio.sleep(1)
+            # Keep the daemon running until a signal sets the stop event, or the
+            # server stops by itself
+            stop_wait = asyncio.create_task(self._stop_event.wait())
+            await asyncio.wait(
+                (self._serve_task, stop_wait), return_when=asyncio.FIRST_COMPLETED
+            )
+            stop_wait.cancel()
+            if self._serve_task.done():
+                self._serve_task.result()
 
             return True
 
         except Exception as e:
-            self.logger.error(f"Error in daemon: {e}", exc_info=True)
+            self.logger.error("Error in daemon: %s", e, exc_info=True)
             return False
 
     async def shutdown(self):
@@ -203,16 +252,23 @@ class ESPHomeBluetoothProxyDaemon:
         if self.server and self.running:
             self.logger.info("Shutting down daemon...")
             self.running = False
+            self._stop_event.set()
 
-            # Shutdown server
-            if hasattr(self.server, "stop"):
-                await self.server.stop()
+            # Shutdown server; closing it ends serve_forever() in the serve task
+            await self.server.stop()
+            if self._serve_task:
+                await asyncio.gather(self._serve_task, return_exceptions=True)
 
             self.logger.info("Daemon shutdown complete")
 
+        # Drain queued log records to the real handlers
+        if self._log_listener:
+            self._log_listener.stop()
+            self._log_listener = None
 
-def parse_arguments():
-    """Parse command line arguments."""
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line argument parser."""
     parser = argparse.ArgumentParser(
         description="ESPHome Python Bluetooth Proxy Daemon"
     )
@@ -281,7 +337,15 @@ def parse_arguments():
         help="Advertisement batch size (default: 16)",
     )
 
-    return parser.parse_args()
+    return parser
+
+
+_PARSER = _build_parser()
+
+
+def parse_arguments():
+    """Parse command line arguments."""
+    return _PARSER.parse_args()
 
 
 async def main():
@@ -306,13 +370,23 @@ async def main():
     # Setup logging
     daemon.setup_logging()
 
-    # Setup signal handlers
-    def signal_handler(signum, frame):
-        daemon.logger.info(f"Received signal {signum}, shutting down...")
-        asyncio.create_task(daemon.shutdown())
+    # Setup signal handlers on the running loop so they fire in the loop thread.
+    # They only wake run_forever(); shutdown() then runs once, from finally below
+    loop = asyncio.get_running_loop()
 
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    def signal_handler(signum):
+        daemon.logger.info("Received signal %s, shutting down...", signum)
+        daemon._stop_event.set()
+
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, signal_handler, sig)
+        except NotImplementedError:
+            # Windows event loops do not support add_signal_handler
+            signal.signal(
+                sig,
+                lambda signum, frame: loop.call_soon_threadsafe(signal_handler, signum),
+            )
 
     try:
         # Run daemon
@@ -320,7 +394,7 @@ async def main():
     except KeyboardInterrupt:
         daemon.logger.info("Daemon interrupted by user")
     except Exception as e:
-        daemon.logger.error(f"Daemon failed with exception: {e}", exc_info=True)
+        daemon.logger.error("Daemon failed with exception: %s", e, exc_info=True)
         return False
     finally:
         await daemon.shutdown()
@@ -329,4 +403,6 @@ async def main():
 
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     sys.exit(0 if asyncio.run(main()) else 1)
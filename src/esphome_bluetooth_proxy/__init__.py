@@ -1,32 +1,21 @@
 """ESPHome Python Bluetooth Proxy.
 
 A Python implementation of the ESPHome Bluetooth proxy functionality.
-"""
-
-__version__ = "0.1.0"
-
-from .advertisement_batcher import AdvertisementBatcher
-
-# Phase 1: Core API Server Components
-from .api_server import ESPHomeAPIServer
-
-# Phase 3: BLE Connection Components
-from .ble_connection import BLECharacteristic, BLEConnection, BLEDescriptor, BLEService
 
-# Phase 2: BLE Scanning Components
-from .ble_scanner import BLEAdvertisement, BLEScanner
+Public classes are imported lazily on first attribute access (PEP 562), so
+``import esphome_bluetooth_proxy`` does not pull in bleak or the protocol stack
+until one of them is actually used.
+"""
 
-# Main Coordinator
-from .bluetooth_proxy import BluetoothProxy
-from .connection import APIConnection, ConnectionState
-from .device_info import BluetoothProxyFeature, DeviceInfoProvider
+import importlib
+from typing import TYPE_CHECKING, Any, List
 
-# Phase 4-6: GATT Operations and Advanced Features
-from .gatt_operations import GATTOperationHandler
-from .pairing_manager import PairingManager, PairingState
-from .protocol import MessageDecoder, MessageEncoder, MessageType
+__version__ = "0.1.0"
+__author__ = "bmcdonough"
 
-__all__ = [
+__all__ = (
+    # Main Coordinator
+    "BluetoothProxy",
     # Phase 1: Core API Server
     "ESPHomeAPIServer",
     "APIConnection",
@@ -49,7 +38,67 @@ __all__ = [
     "GATTOperationHandler",
     "PairingManager",
     "PairingState",
-    # Main Coordinator
-    "BluetoothProxy",
-]
-__author__ = "bmcdonough"
+)
+
+# Public name -> submodule that defines it, most frequently accessed first
+_LAZY = {
+    # Main Coordinator and API server
+    "BluetoothProxy": ".bluetooth_proxy",
+    "ESPHomeAPIServer": ".api_server",
+    # Phase 1: Core API Server Components
+    "APIConnection": ".connection",
+    "ConnectionState": ".connection",
+    "DeviceInfoProvider": ".device_info",
+    "BluetoothProxyFeature": ".device_info",
+    "MessageType": ".protocol",
+    "MessageEncoder": ".protocol",
+    "MessageDecoder": ".protocol",
+    # Phase 2: BLE Scanning Components
+    "BLEScanner": ".ble_scanner",
+    "BLEAdvertisement": ".ble_scanner",
+    "AdvertisementBatcher": ".advertisement_batcher",
+    # Phase 3: BLE Connection Components
+    "BLEConnection": ".ble_connection",
+    "BLEService": ".ble_connection",
+    "BLECharacteristic": ".ble_connection",
+    "BLEDescriptor": ".ble_connection",
+    # Phase 4-6: GATT Operations and Advanced Features
+    "GATTOperationHandler": ".gatt_operations",
+    "PairingManager": ".pairing_manager",
+    "PairingState": ".pairing_manager",
+}
+
+if TYPE_CHECKING:
+    from .advertisement_batcher import AdvertisementBatcher
+    from .api_server import ESPHomeAPIServer
+    from .ble_connection import (
+        BLECharacteristic,
+        BLEConnection,
+        BLEDescriptor,
+        BLEService,
+    )
+    from .ble_scanner import BLEAdvertisement, BLEScanner
+    from .bluetooth_proxy import BluetoothProxy
+    from .connection import APIConnection, ConnectionState
+    from .device_info import BluetoothProxyFeature, DeviceInfoProvider
+    from .gatt_operations import GATTOperationHandler
+    from .pairing_manager import PairingManager, PairingState
+    from .protocol import MessageDecoder, MessageEncoder, MessageType
+
+
+def __getattr__(name: str) -> Any:
+    """Import public classes from their submodule on first access."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List public names, including those not yet imported."""
+    return sorted(set(globals()) | set(__all__))
@@ -6,10 +6,11 @@ matching the optimization strategy used in the ESPHome C++ implementation.
 
 import asyncio
 import logging
-import time
-from typing import Callable, List, Optional
+from collections import deque
+from typing import Any, Callable, Dict, Final, List, Optional
 
 from .ble_scanner import BLEAdvertisement
+from .protocol import MessageEncoder, MessageType, create_frame_header
 
 logger = logging.getLogger(__name__)
 
@@ -24,27 +25,57 @@ class AdvertisementBatcher:
     """
 
     # Match ESPHome C++ constants
-    FLUSH_BATCH_SIZE = 16  # Optimal batch size for WiFi MTU
-    FLUSH_TIMEOUT_MS = 100  # Maximum time to wait before flushing
-
-    def __init__(self, send_callback: Callable[[List[BLEAdvertisement]], None]):
+    FLUSH_BATCH_SIZE: Final = 16  # Optimal batch size for WiFi MTU
+    FLUSH_TIMEOUT_MS: Final = 100  # Maximum time to wait before flushing
+    FLUSH_TIMEOUT_S: Final = FLUSH_TIMEOUT_MS / 1000.0
+
+    # Fixed attribute set, touched per advertisement
+    __slots__ = (
+        "send_callback",
+        "encoder",
+        "advertisement_batch",
+        "advertisement_pool",
+        "last_flush_time",
+        "_loop",
+        "flush_timer",
+        "_debug",
+    )
+
+    def __init__(self, send_callback: Callable[[List[bytes]], None]):
         """Initialize advertisement batcher.
 
+        Must be called from a coroutine; the running event loop is cached for
+        flush timing.
+
         Args:
-            send_callback: Function to call when batch is ready to send
+            send_callback: Function to call with the serialized batch (see
+                serialize_batch) when it is ready to send. Called synchronously
+                from the event loop, so it must not block.
         """
-        self.send_callback = send_callback
+        self.send_callback: Callable[[List[bytes]], None] = send_callback
+        self.encoder: MessageEncoder = MessageEncoder()
 
         # Batching state
         self.advertisement_batch: List[BLEAdvertisement] = []
-        self.advertisement_pool: List[BLEAdvertisement] = []
-        self.last_flush_time = 0
+        # Pre-filled so steady state never allocates advertisements; maxlen
+        # bounds the pool without an explicit size check
+        self.advertisement_pool: deque[BLEAdvertisement] = deque(
+            (BLEAdvertisement() for _ in range(self.FLUSH_BATCH_SIZE * 2)),
+            maxlen=self.FLUSH_BATCH_SIZE * 2,
+        )
+        self.last_flush_time: float = 0.0  # Event loop (monotonic) time in seconds
 
-        # Flush timer
+        # Event loop whose monotonic clock drives flush timing
+        self._loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+
+        # Flush timer, armed iff the batch is non-empty
         self.flush_timer: Optional[asyncio.TimerHandle] = None
 
+        # Checked once so the per-advertisement path skips debug logging entirely
+        self._debug: bool = logger.isEnabledFor(logging.DEBUG)
+
         logger.debug(
-            f"Advertisement batcher initialized (batch_size={self.FLUSH_BATCH_SIZE})"
+            "Advertisement batcher initialized (batch_size=%d)", self.FLUSH_BATCH_SIZE
         )
 
     def add_advertisement(self, advertisement: BLEAdvertisement) -> None:
@@ -54,57 +85,76 @@ class AdvertisementBatcher:
             advertisement: BLE advertisement to add
         """
         # Add to current batch
-        self.advertisement_batch.append(advertisement)
-
-        logger.debug(
-            f"Added advertisement from {advertisement.address:012X} "
-            f"(batch size: {len(self.advertisement_batch)}/{self.FLUSH_BATCH_SIZE})"
-        )
-
-        # Check if we should flush
-        if self._should_flush():
-            asyncio.create_task(self.flush_batch())
-        elif not self.flush_timer:
-            # Start flush timer if not already running
+        batch = self.advertisement_batch
+        batch.append(advertisement)
+        size = len(batch)
+
+        if self._debug:
+            logger.debug(
+                "Added advertisement from %012X (batch size: %d/%d)",
+                advertisement.address,
+                size,
+                self.FLUSH_BATCH_SIZE,
+            )
+
+        # Flush when the batch is full; the flush timer covers the timeout
+        if size >= self.FLUSH_BATCH_SIZE:
+            self._do_flush()
+        elif size == 1:
+            # First advertisement of a new batch arms the flush timer
             self._start_flush_timer()
 
-    def _should_flush(self) -> bool:
-        """Check if batch should be flushed.
+    def add_advertisements(self, advertisements: List[BLEAdvertisement]) -> None:
+        """Add a burst of advertisements to the batch in one call.
 
-        Returns:
-            bool: True if batch should be flushed
-        """
-        # Flush if batch is full
-        if len(self.advertisement_batch) >= self.FLUSH_BATCH_SIZE:
-            return True
+        A burst that fills the batch is flushed as a single frame, even if it
+        holds more than FLUSH_BATCH_SIZE advertisements.
 
-        # Flush if timeout exceeded
-        current_time = time.time() * 1000  # Convert to milliseconds
-        if (current_time - self.last_flush_time) >= self.FLUSH_TIMEOUT_MS:
-            return True
+        Args:
+            advertisements: BLE advertisements to add
+        """
+        if not advertisements:
+            return
 
-        return False
+        batch = self.advertisement_batch
+        was_empty = not batch
+        batch.extend(advertisements)
+        size = len(batch)
+
+        if self._debug:
+            logger.debug(
+                "Added %d advertisements (batch size: %d/%d)",
+                len(advertisements),
+                size,
+                self.FLUSH_BATCH_SIZE,
+            )
+
+        if size >= self.FLUSH_BATCH_SIZE:
+            self._do_flush()
+        elif was_empty:
+            # First advertisements of a new batch arm the flush timer
+            self._start_flush_timer()
 
     def _start_flush_timer(self) -> None:
-        """Start the flush timer."""
-        if self.flush_timer:
-            self.flush_timer.cancel()
-
-        # Calculate timeout
-        timeout_seconds = self.FLUSH_TIMEOUT_MS / 1000.0
+        """Start the flush timer.
 
-        # Schedule flush
-        loop = asyncio.get_event_loop()
-        self.flush_timer = loop.call_later(timeout_seconds, self._on_flush_timeout)
+        Only called when the batch goes from empty to non-empty, so no timer
+        can already be pending.
+        """
+        self.flush_timer = self._loop.call_later(
+            self.FLUSH_TIMEOUT_S, self._on_flush_timeout
+        )
 
     def _on_flush_timeout(self) -> None:
         """Handle flush timeout."""
         self.flush_timer = None
-        if self.advertisement_batch:
-            asyncio.create_task(self.flush_batch())
+        self._do_flush()
 
-    async def flush_batch(self) -> None:
-        """Flush current batch of advertisements."""
+    def _do_flush(self) -> None:
+        """Flush current batch of advertisements synchronously.
+
+        ``send_callback`` is invoked inline, so no task is scheduled per batch.
+        """
         if not self.advertisement_batch:
             return
 
@@ -113,39 +163,76 @@ class AdvertisementBatcher:
             self.flush_timer.cancel()
             self.flush_timer = None
 
-        # Get current batch
-        batch_to_send = self.advertisement_batch.copy()
+        # Hand off the current batch and start a fresh one (no copy)
+        batch_to_send = self.advertisement_batch
         batch_size = len(batch_to_send)
-
-        # Clear current batch
-        self.advertisement_batch.clear()
+        self.advertisement_batch = []
 
         # Update flush time
-        self.last_flush_time = time.time() * 1000
+        self.last_flush_time = self._loop.time()
 
-        logger.debug(f"Flushing advertisement batch ({batch_size} advertisements)")
+        if self._debug:
+            logger.debug("Flushing advertisement batch (%d advertisements)", batch_size)
 
         try:
-            # Send batch via callback
-            self.send_callback(batch_to_send)
+            # Serialize while the advertisements are still ours, then send
+            self.send_callback(self.serialize_batch(batch_to_send))
 
             # Move advertisements to pool for reuse (memory optimization)
-            self.advertisement_pool.extend(batch_to_send)
-
-            # Limit pool size to prevent memory growth
-            if len(self.advertisement_pool) > self.FLUSH_BATCH_SIZE * 2:
-                self.advertisement_pool = self.advertisement_pool[
-                    -self.FLUSH_BATCH_SIZE :
-                ]
+            for advertisement in batch_to_send:
+                self.release(advertisement)
 
         except Exception as e:
-            logger.error(f"Error sending advertisement batch: {e}")
+            logger.error("Error sending advertisement batch: %s", e)
+
+    def serialize_batch(self, batch: List[BLEAdvertisement]) -> List[bytes]:
+        """Serialize a batch into one BluetoothLERawAdvertisementsResponse frame.
+
+        The frame is returned as a list of chunks (frame header followed by one
+        chunk per advertisement) so it can be handed to ``writer.writelines()``
+        and go out in a single gather write, without joining it first.
+
+        Args:
+            batch: Advertisements to serialize
+
+        Returns:
+            List[bytes]: Frame header and advertisement chunks
+        """
+        chunks = self.encoder.encode_bluetooth_le_advertisements(batch)
+        header = create_frame_header(
+            MessageType.BLUETOOTH_LE_RAW_ADVERTISEMENTS_RESPONSE, sum(map(len, chunks))
+        )
+        return [header, *chunks]
+
+    def acquire(self) -> BLEAdvertisement:
+        """Rent an advertisement from the pool, allocating only on a miss.
+
+        Returns:
+            BLEAdvertisement: Reset advertisement ready to be filled in
+        """
+        if self.advertisement_pool:
+            return self.advertisement_pool.pop()
+        return BLEAdvertisement()
+
+    def release(self, advertisement: BLEAdvertisement) -> None:
+        """Return an advertisement to the pool.
+
+        Args:
+            advertisement: Advertisement that is no longer referenced
+        """
+        advertisement.reset()
+        # Bounded by maxlen, so the pool never grows past 2 * FLUSH_BATCH_SIZE
+        self.advertisement_pool.append(advertisement)
+
+    async def flush_batch(self) -> None:
+        """Flush current batch of advertisements."""
+        self._do_flush()
 
     async def force_flush(self) -> None:
         """Force flush of current batch regardless of size."""
         if self.advertisement_batch:
             logger.debug("Force flushing advertisement batch")
-            await self.flush_batch()
+            self._do_flush()
 
     def get_batch_size(self) -> int:
         """Get current batch size."""
@@ -165,7 +252,7 @@ class AdvertisementBatcher:
         self.advertisement_batch.clear()
 
         if batch_size > 0:
-            logger.debug(f"Cleared advertisement batch ({batch_size} advertisements)")
+            logger.debug("Cleared advertisement batch (%d advertisements)", batch_size)
 
     def start(self) -> None:
         """No-op start method for API compatibility.
@@ -177,17 +264,15 @@ class AdvertisementBatcher:
         pass
 
     def stop(self) -> None:
-        """No-op stop method for API compatibility.
+        """Flush any pending advertisements.
 
         This method is called by bluetooth_proxy.py when stopping BLE scanning,
-        but the AdvertisementBatcher doesn't need explicit start/stop handling.
+        so advertisements still waiting on the flush timer are not lost.
         """
-        logger.debug("AdvertisementBatcher.stop() called (no-op)")
-        # Force flush any remaining advertisements when stopping
-        self.force_flush()
-        pass
+        logger.debug("AdvertisementBatcher.stop() called")
+        self._do_flush()
 
-    def get_stats(self) -> dict:
+    def get_stats(self) -> Dict[str, Any]:
         """Get batching statistics.
 
         Returns:
@@ -201,5 +286,3 @@ class AdvertisementBatcher:
             "last_flush_time": self.last_flush_time,
             "timer_active": self.flush_timer is not None,
         }
-        logger.debug("Advertisement batcher started (no-op)")
-        # No action needed - batcher is ready to use after initialization
@@ -9,11 +9,12 @@ import logging
 import signal
 import sys
 from asyncio import StreamReader, StreamWriter
-from typing import List, Optional
+from typing import Any, Coroutine, List, Optional, Set
 
 from .bluetooth_proxy import BluetoothProxy
 from .connection import APIConnection
 from .device_info import DeviceInfoProvider
+from .protocol import create_message_frame
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +30,7 @@ class ESPHomeAPIServer:
         friendly_name: str = "Python Bluetooth Proxy",
         password: Optional[str] = None,
         active_connections: bool = False,
+        handle_signals: bool = False,
     ):
         """Initialize the API server.
 
@@ -39,10 +41,14 @@ class ESPHomeAPIServer:
             friendly_name: Human-readable device name
             password: Optional API password
             active_connections: Whether to support active BLE connections
+            handle_signals: Whether start() installs SIGINT/SIGTERM handlers that
+                shut the server down. Off by default, so an embedding
+                application keeps control of process signals
         """
         self.host = host
         self.port = port
         self.password = password
+        self.handle_signals = handle_signals
 
         # Device information provider
         self.device_info_provider = DeviceInfoProvider(
@@ -53,39 +59,77 @@ class ESPHomeAPIServer:
         )
 
         # Connection management
-        self.connections: List[APIConnection] = []
+        self.connections: Set[APIConnection] = set()
+        self._authenticated: Set[APIConnection] = set()
         self.server: Optional[asyncio.Server] = None
         self.running = False
         self._shutdown_requested = False
 
+        # Set once the server is listening; start() itself only returns when
+        # the server stops
+        self.started = asyncio.Event()
+
+        # Tasks owned by the server, cancelled on shutdown
+        self._tasks: Set[asyncio.Task] = set()
+
         # Bluetooth proxy
         self.bluetooth_proxy: Optional[BluetoothProxy] = None
 
-        # Setup signal handlers for graceful shutdown
-        self._setup_signal_handlers()
-
     def _setup_signal_handlers(self) -> None:
-        """Setup signal handlers for graceful shutdown."""
-        if sys.platform != "win32":
-            for sig in (signal.SIGTERM, signal.SIGINT):
-                signal.signal(sig, self._signal_handler)
+        """Setup signal handlers for graceful shutdown.
+
+        Must be called from the running event loop, so that signals are
+        delivered directly in the loop thread.
+        """
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            try:
+                loop.add_signal_handler(sig, self._signal_handler, sig)
+            except NotImplementedError:
+                # Windows event loops do not support add_signal_handler
+                signal.signal(
+                    sig,
+                    lambda signum, frame: loop.call_soon_threadsafe(
+                        self._signal_handler, signum
+                    ),
+                )
 
-    def _signal_handler(self, signum: int, frame) -> None:
-        """Handle shutdown signals."""
+    def _signal_handler(self, signum: int) -> None:
+        """Handle shutdown signals (runs in the event loop thread)."""
         if self._shutdown_requested:
             return  # Already shutting down, ignore additional signals
 
         logger.info(f"Received signal {signum}, shutting down...")
+        # running stays set until stop() runs, or stop() would return early
         self._shutdown_requested = True
-        self.running = False
 
-        # Set the shutdown flag for the event loop to handle
-        try:
-            loop = asyncio.get_running_loop()
-            loop.call_soon_threadsafe(lambda: asyncio.create_task(self._shutdown()))
-        except RuntimeError:
-            # No running loop, exit immediately
-            sys.exit(0)
+        self.spawn(self._shutdown())
+
+    def spawn(self, coro: Coroutine[Any, Any, Any]) -> asyncio.Task:
+        """Create a task owned by the server.
+
+        The task is tracked until it finishes so that shutdown can cancel it.
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            asyncio.Task: The created task
+        """
+        return self._own(asyncio.create_task(coro))
+
+    def _own(self, task: asyncio.Task) -> asyncio.Task:
+        """Track a task as owned by the server until it finishes.
+
+        Args:
+            task: Task to track
+
+        Returns:
+            asyncio.Task: The same task
+        """
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
 
     async def start(self) -> None:
         """Start the API server."""
@@ -94,6 +138,10 @@ class ESPHomeAPIServer:
             return
 
         try:
+            # Setup signal handlers for graceful shutdown, if asked to
+            if self.handle_signals:
+                self._setup_signal_handlers()
+
             # Initialize Bluetooth MAC address before starting server
             if not self.device_info_provider.bluetooth_mac_address:
                 self.device_info_provider.bluetooth_mac_address = (
@@ -110,6 +158,7 @@ class ESPHomeAPIServer:
             )
 
             self.running = True
+            self.started.set()
 
             addr = self.server.sockets[0].getsockname()
             logger.info(f"ESPHome API server started on {addr[0]}:{addr[1]}")
@@ -140,42 +189,26 @@ class ESPHomeAPIServer:
             raise
 
     async def _shutdown(self) -> None:
-        """Internal shutdown method called from signal handler."""
+        """Internal shutdown method called from signal handler.
+
+        Closing the listener ends serve_forever(), so start() returns and the
+        caller's main finishes on its own; the loop is never stopped here.
+        """
         await self.stop()
 
-        # Get current task to avoid cancelling ourselves
-        current_task = asyncio.current_task()
-        tasks = [
-            task
-            for task in asyncio.all_tasks()
-            if not task.done() and task is not current_task
-        ]
-
-        if tasks:
-            logger.info(f"Cancelling {len(tasks)} remaining tasks...")
-            for task in tasks:
-                if not task.cancelled():
-                    task.cancel()
-
-            # Wait for tasks to complete cancellation with timeout
-            if tasks:
-                try:
-                    await asyncio.wait_for(
-                        asyncio.gather(*tasks, return_exceptions=True), timeout=3.0
-                    )
-                except asyncio.TimeoutError:
-                    logger.warning(
-                        "Some tasks did not complete cancellation within timeout"
-                    )
-                except Exception as e:
-                    logger.warning(f"Error during task cancellation: {e}")
-
-        # Stop the event loop
-        try:
-            loop = asyncio.get_running_loop()
-            loop.stop()
-        except Exception as e:
-            logger.warning(f"Error stopping event loop: {e}")
+        # Wait for the server's own tasks, except this one; connection handlers
+        # end by themselves now that stop() closed their sockets
+        self._tasks.discard(asyncio.current_task())
+        tasks = list(self._tasks)
+        if not tasks:
+            return
+        _, pending = await asyncio.wait(tasks, timeout=3.0)
+
+        if pending:
+            logger.info(f"Cancelling {len(pending)} remaining tasks...")
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
 
     async def stop(self) -> None:
         """Stop the API server."""
@@ -184,6 +217,7 @@ class ESPHomeAPIServer:
 
         logger.info("Stopping API server...")
         self.running = False
+        self.started.clear()
 
         # Stop Bluetooth proxy
         if self.bluetooth_proxy:
@@ -191,14 +225,13 @@ class ESPHomeAPIServer:
             logger.info("Bluetooth proxy stopped")
 
         # Close all client connections
-        close_tasks = []
-        for connection in self.connections:
-            close_tasks.append(connection.close())
+        close_tasks = [connection.close() for connection in list(self.connections)]
 
         if close_tasks:
             await asyncio.gather(*close_tasks, return_exceptions=True)
 
         self.connections.clear()
+        self._authenticated.clear()
 
         # Stop the server
         if self.server:
@@ -214,14 +247,17 @@ class ESPHomeAPIServer:
             writer=writer,
             device_info_provider=self.device_info_provider.get_device_info,
             password=self.password,
+            on_authenticated=self._on_auth,
         )
 
         # Add GATT handler reference if Bluetooth proxy is available
         if self.bluetooth_proxy and hasattr(self.bluetooth_proxy, "gatt_handler"):
             connection.gatt_handler = self.bluetooth_proxy.gatt_handler
 
-        # Add to connection list
-        self.connections.append(connection)
+        # Add to connection set; the handler task is created by asyncio's
+        # server, so it is adopted rather than spawned
+        self.connections.add(connection)
+        self._own(asyncio.current_task())
 
         try:
             # Subscribe to Bluetooth events (will check authentication state internally)
@@ -238,33 +274,62 @@ class ESPHomeAPIServer:
             except Exception as e:
                 logger.error(f"Error unsubscribing connection: {e}")
 
-            # Remove from connection list
-            if connection in self.connections:
-                self.connections.remove(connection)
+            # Remove from connection sets
+            self.connections.discard(connection)
+            self._authenticated.discard(connection)
+
+    def _on_auth(self, connection: APIConnection) -> None:
+        """Record a connection that has completed authentication.
+
+        Args:
+            connection: Newly authenticated API connection
+        """
+        self._authenticated.add(connection)
 
     def get_authenticated_connections(self) -> List[APIConnection]:
         """Get list of authenticated connections."""
-        return [conn for conn in self.connections if conn.is_authenticated()]
+        return list(self._authenticated)
 
     def get_connection_count(self) -> int:
         """Get total number of active connections."""
-        return len([conn for conn in self.connections if conn.is_connected()])
+        return len(self.connections)
 
     async def broadcast_message(self, msg_type: int, payload: bytes) -> None:
         """Broadcast a message to all authenticated connections."""
-        authenticated_connections = self.get_authenticated_connections()
-
-        if not authenticated_connections:
+        if not self._authenticated:
             return
 
-        # Send to all authenticated connections
-        send_tasks = []
-        for connection in authenticated_connections:
-            send_tasks.append(connection.send_message(msg_type, payload))
+        # Frame once; every connection writes the same immutable bytes
+        framed = create_message_frame(msg_type, payload)
+
+        # Send to all authenticated connections and wait for all sends to
+        # complete; sends are server-owned so shutdown can cancel them
+        if sys.version_info >= (3, 11):
+            async with asyncio.TaskGroup() as tg:
+                for connection in self._authenticated:
+                    self._own(tg.create_task(self._send_quietly(connection, framed)))
+        else:
+            await asyncio.gather(
+                *[
+                    self.spawn(self._send_quietly(connection, framed))
+                    for connection in self._authenticated
+                ],
+                return_exceptions=True,
+            )
 
-        # Wait for all sends to complete
-        if send_tasks:
-            await asyncio.gather(*send_tasks, return_exceptions=True)
+    @staticmethod
+    async def _send_quietly(connection: APIConnection, framed: bytes) -> None:
+        """Send a frame, swallowing errors so one client can't fail a broadcast.
+
+        Args:
+            connection: API connection to send to
+            framed: Complete message frame
+        """
+        try:
+            await connection.send_framed(framed)
+        except Exception:
+            # Already logged by APIConnection.send_framed
+            pass
 
     def set_active_connections(self, active: bool) -> None:
         """Set whether active connections are supported.
@@ -284,7 +349,7 @@ class ESPHomeAPIServer:
         """
         if self.bluetooth_proxy:
             await self.bluetooth_proxy.subscribe_api_connection(connection, flags=0)
-            logger.debug(f"Subscribed {connection.client_address} to Bluetooth events")
+            logger.debug("Subscribed %s to Bluetooth events", connection.client_address)
 
     async def unsubscribe_connection_from_bluetooth(
         self, connection: APIConnection
@@ -297,7 +362,7 @@ class ESPHomeAPIServer:
         if self.bluetooth_proxy:
             await self.bluetooth_proxy.unsubscribe_api_connection(connection)
             logger.debug(
-                f"Unsubscribed {connection.client_address} from Bluetooth events"
+                "Unsubscribed %s from Bluetooth events", connection.client_address
             )
 
     def has_active_connections(self) -> bool:
@@ -319,6 +384,7 @@ async def main() -> None:
         friendly_name="Test Python Bluetooth Proxy",
         password=None,  # No password for testing
         active_connections=False,  # Start with passive scanning only
+        handle_signals=True,
     )
 
     try:
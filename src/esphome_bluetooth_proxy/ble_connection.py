@@ -5,16 +5,40 @@ corresponding to the BluetoothConnection class in the ESPHome C++ implementation
 """
 
 import asyncio
+import functools
+import itertools
 import logging
+from collections import OrderedDict
 from dataclasses import dataclass
 from enum import IntEnum
-from typing import Callable, Dict, List, Optional
+from typing import Any, Callable, Coroutine, Dict, Iterable, List, Optional, Set
 
 from bleak import BleakClient
 from bleak.backends.characteristic import BleakGATTCharacteristic
+from bleak.backends.descriptor import BleakGATTDescriptor
+from bleak.backends.service import BleakGATTService
 
 logger = logging.getLogger(__name__)
 
+# Bluetooth Base UUID suffix (xxxxxxxx-0000-1000-8000-00805F9B34FB)
+_BASE_UUID_SUFFIX = bytes.fromhex("00001000800000805f9b34fb")
+
+# Cached service tables kept per connection slot. Recently seen devices tend to
+# reconnect, but the cache must not grow with every device ever connected
+SERVICE_CACHE_PER_SLOT = 4
+
+# GATT Service Changed characteristic (0x2A05)
+_SERVICE_CHANGED_UUID = "00002a05-0000-1000-8000-00805f9b34fb"
+
+# Bleak characteristic property names -> ESPHome property bit flags
+_PROP_MAP = {
+    "read": 0x02,
+    "write-without-response": 0x04,
+    "write": 0x08,
+    "notify": 0x10,
+    "indicate": 0x20,
+}
+
 
 class ConnectionState(IntEnum):
     """BLE connection state."""
@@ -25,7 +49,7 @@ class ConnectionState(IntEnum):
     DISCONNECTING = 3
 
 
-@dataclass
+@dataclass(slots=True)
 class BLEService:
     """BLE GATT service information."""
 
@@ -34,7 +58,7 @@ class BLEService:
     characteristics: List["BLECharacteristic"]
 
 
-@dataclass
+@dataclass(slots=True)
 class BLECharacteristic:
     """BLE GATT characteristic information."""
 
@@ -44,7 +68,7 @@ class BLECharacteristic:
     descriptors: List["BLEDescriptor"]
 
 
-@dataclass
+@dataclass(slots=True)
 class BLEDescriptor:
     """BLE GATT descriptor information."""
 
@@ -52,6 +76,49 @@ class BLEDescriptor:
     handle: int
 
 
+@functools.lru_cache(maxsize=1024)
+def _uuid_to_bytes(uuid_str: str) -> bytes:
+    """Convert UUID string to 16-byte array.
+
+    Cached, since devices expose the same handful of standard UUIDs.
+
+    Args:
+        uuid_str: UUID string
+
+    Returns:
+        bytes: 16-byte UUID
+    """
+    # Remove hyphens and convert to bytes
+    uuid_hex = uuid_str.replace("-", "")
+    if len(uuid_hex) == 4:  # 16-bit UUID
+        return b"\x00\x00" + bytes.fromhex(uuid_hex) + _BASE_UUID_SUFFIX
+    elif len(uuid_hex) == 8:  # 32-bit UUID
+        return bytes.fromhex(uuid_hex) + _BASE_UUID_SUFFIX
+
+    return bytes.fromhex(uuid_hex)
+
+
+def _gatt_handles(services: Iterable[Any]) -> Set[int]:
+    """Collect every service, characteristic and descriptor handle.
+
+    Works on both BLEService lists and bleak services, which share the
+    handle/characteristics/descriptors attribute names.
+
+    Args:
+        services: Services to walk
+
+    Returns:
+        Set[int]: All attribute handles
+    """
+    handles = set()
+    for service in services:
+        handles.add(service.handle)
+        for char in service.characteristics:
+            handles.add(char.handle)
+            handles.update(desc.handle for desc in char.descriptors)
+    return handles
+
+
 class BLEConnection:
     """Individual BLE device connection handler.
 
@@ -59,6 +126,11 @@ class BLEConnection:
     ESPHome C++ implementation, managing GATT operations for a single device.
     """
 
+    # Converted GATT services by device address, reused across reconnects;
+    # least recently used first, bounded by _service_cache_size
+    _SERVICE_CACHE: "OrderedDict[int, List[BLEService]]" = OrderedDict()
+    _service_cache_size = 3 * SERVICE_CACHE_PER_SLOT
+
     def __init__(self, address: int, address_type: int, proxy):
         """Initialize BLE connection.
 
@@ -84,11 +156,91 @@ class BLEConnection:
         self.service_discovery_complete = False
         self.send_service_index = -2  # Match ESPHome: -2 = not started, -1 = done
 
-        # GATT operation tracking
+        # Handle -> bleak object indexes, built from the discovered services
+        self._char_by_handle: Dict[int, BleakGATTCharacteristic] = {}
+        self._desc_by_handle: Dict[int, BleakGATTDescriptor] = {}
+        # Snapshot of the client's services; some backends build a new
+        # collection on every access of client.services
+        self._bleak_services: List[BleakGATTService] = []
+
+        # GATT operation tracking; tasks started through create_task() stay
+        # here until done and are cancelled when the device goes away
         self.pending_operations: Dict[int, asyncio.Future] = {}
+        self._op_ids = itertools.count()
+        # Cleanup scheduled by the bleak disconnect callback after a link drop
+        self._link_lost_task: Optional[asyncio.Task] = None
         self.notification_handlers: Dict[int, Callable[[bytes], None]] = {}
 
-        logger.debug(f"Created BLE connection for {self.address_str}")
+        logger.debug("Created BLE connection for %s", self.address_str)
+
+    def reset(self) -> None:
+        """Return the connection to its unassigned state for reuse.
+
+        Called when a pooled connection is released. Containers are cleared in
+        place rather than reallocated, except ``services``, which may be the
+        list held by the service cache and is only rebound.
+        """
+        self.address = 0
+        self.address_type = 0
+        self.address_str = ""
+
+        self.state = ConnectionState.DISCONNECTED
+        self.client = None
+        self.mtu = 23
+
+        self.services = []
+        self.service_discovery_complete = False
+        self.send_service_index = -2
+
+        self._char_by_handle.clear()
+        self._desc_by_handle.clear()
+        self._bleak_services.clear()
+        self._cancel_pending()
+        self.notification_handlers.clear()
+
+    def create_task(self, coro: Coroutine[Any, Any, Any]) -> asyncio.Task:
+        """Run a coroutine that belongs to this device connection.
+
+        The task is cancelled if the device disconnects before it finishes.
+
+        Args:
+            coro: Coroutine to run, e.g. forwarding a notification
+
+        Returns:
+            asyncio.Task: The created task
+        """
+        task = asyncio.create_task(coro)
+        self._track(next(self._op_ids), task)
+        return task
+
+    def _cancel_pending(self) -> List[asyncio.Future]:
+        """Cancel all tracked operations and stop tracking them.
+
+        Returns:
+            List[asyncio.Future]: The cancelled operations, to await if needed
+        """
+        # Tracked futures drop out when done, so everything left is live
+        pending = list(self.pending_operations.values())
+        self.pending_operations.clear()
+        for future in pending:
+            future.cancel()
+        return pending
+
+    def _track(self, op_id: int, future: asyncio.Future) -> None:
+        """Track a pending GATT operation until it completes.
+
+        Args:
+            op_id: Operation identifier
+            future: Future for the operation
+        """
+        self.pending_operations[op_id] = future
+
+        def _untrack(done: asyncio.Future) -> None:
+            # Only drop the entry if it has not been replaced since
+            if self.pending_operations.get(op_id) is done:
+                del self.pending_operations[op_id]
+
+        future.add_done_callback(_untrack)
 
     def _address_to_string(self, address: int) -> str:
         """Convert uint64 address to MAC string format.
@@ -99,11 +251,7 @@ class BLEConnection:
         Returns:
             str: MAC address in XX:XX:XX:XX:XX:XX format
         """
-        mac_bytes = []
-        for i in range(6):
-            mac_bytes.append((address >> (i * 8)) & 0xFF)
-        mac_bytes.reverse()
-        return ":".join(f"{b:02X}" for b in mac_bytes)
+        return address.to_bytes(6, "big").hex(":").upper()
 
     async def connect(self) -> bool:
         """Connect to the BLE device.
@@ -113,21 +261,30 @@ class BLEConnection:
         """
         if self.state != ConnectionState.DISCONNECTED:
             logger.warning(
-                f"Connection to {self.address_str} already in progress or connected"
+                "Connection to %s already in progress or connected", self.address_str
             )
             return False
 
-        logger.info(f"Connecting to BLE device {self.address_str}")
+        logger.info("Connecting to BLE device %s", self.address_str)
         self.state = ConnectionState.CONNECTING
+        self._char_by_handle.clear()
+        self._desc_by_handle.clear()
+        self._bleak_services.clear()
 
         try:
-            self.client = BleakClient(self.address_str)
-            await self.client.connect()
+            self.client = BleakClient(
+                self.address_str, disconnected_callback=self._on_bleak_disconnect
+            )
+            # For known devices let BlueZ reuse its cached GATT database instead
+            # of re-enumerating services (ignored by other backends)
+            await self.client.connect(
+                dangerous_use_bleak_cache=self.address in self._SERVICE_CACHE
+            )
 
             self.state = ConnectionState.CONNECTED
             self.mtu = await self._get_mtu()
 
-            logger.info(f"Connected to {self.address_str} (MTU: {self.mtu})")
+            logger.info("Connected to %s (MTU: %d)", self.address_str, self.mtu)
 
             # Notify proxy of connection
             if self.proxy:
@@ -136,9 +293,11 @@ class BLEConnection:
             return True
 
         except Exception as e:
-            logger.error(f"Failed to connect to {self.address_str}: {e}")
+            logger.error("Failed to connect to %s: %s", self.address_str, e)
             self.state = ConnectionState.DISCONNECTED
             self.client = None
+            # The cache also told BlueZ to trust its GATT database; don't again
+            self.invalidate_service_cache(self.address)
 
             # Notify proxy of connection failure
             if self.proxy:
@@ -148,21 +307,22 @@ class BLEConnection:
 
     async def disconnect(self) -> None:
         """Disconnect from the BLE device."""
-        if self.state == ConnectionState.DISCONNECTED:
+        if self.state in (ConnectionState.DISCONNECTED, ConnectionState.DISCONNECTING):
             return
 
-        logger.info(f"Disconnecting from BLE device {self.address_str}")
+        logger.info("Disconnecting from BLE device %s", self.address_str)
         self.state = ConnectionState.DISCONNECTING
 
         try:
-            # Cancel pending operations
-            for future in self.pending_operations.values():
-                if not future.done():
-                    future.cancel()
-            self.pending_operations.clear()
+            pending = self._cancel_pending()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
 
-            # Clear notification handlers
+            # Clear notification handlers and handle indexes
             self.notification_handlers.clear()
+            self._char_by_handle.clear()
+            self._desc_by_handle.clear()
+            self._bleak_services.clear()
 
             # Disconnect client
             if self.client and self.client.is_connected:
@@ -171,14 +331,14 @@ class BLEConnection:
             self.state = ConnectionState.DISCONNECTED
             self.client = None
 
-            logger.info(f"Disconnected from {self.address_str}")
+            logger.info("Disconnected from %s", self.address_str)
 
             # Notify proxy of disconnection
             if self.proxy:
                 await self.proxy.on_device_connected(self.address, False, 0)
 
         except Exception as e:
-            logger.error(f"Error disconnecting from {self.address_str}: {e}")
+            logger.error("Error disconnecting from %s: %s", self.address_str, e)
             self.state = ConnectionState.DISCONNECTED
             self.client = None
 
@@ -191,15 +351,42 @@ class BLEConnection:
         if not self.is_connected():
             raise RuntimeError("Device not connected")
 
-        logger.info(f"Discovering services for {self.address_str}")
+        logger.info("Discovering services for %s", self.address_str)
 
         try:
             # Get services from bleak
-            bleak_services = self.client.services
+            self._bleak_services = list(self.client.services)
+
+            cached_services = self._SERVICE_CACHE.get(self.address)
+            if cached_services is not None:
+                if _gatt_handles(cached_services) == _gatt_handles(
+                    self._bleak_services
+                ):
+                    # Known device: reuse the services converted on a previous
+                    # connect
+                    self._SERVICE_CACHE.move_to_end(self.address)
+                    self.services = cached_services
+                    self._build_handle_index()
+                    self.service_discovery_complete = True
+                    self.send_service_index = 0  # Start sending services
+                    await self._watch_service_changed()
+
+                    logger.info(
+                        "Using %d cached services for %s",
+                        len(self.services),
+                        self.address_str,
+                    )
+                    return self.services
+
+                logger.info(
+                    "GATT table of %s changed, dropping cached services",
+                    self.address_str,
+                )
+                self.invalidate_service_cache(self.address)
 
             # Convert to our format
             self.services = []
-            for service in bleak_services:
+            for service in self._bleak_services:
                 characteristics = []
 
                 for char in service.characteristics:
@@ -207,13 +394,13 @@ class BLEConnection:
                     for desc in char.descriptors:
                         descriptors.append(
                             BLEDescriptor(
-                                uuid=self._uuid_to_bytes(desc.uuid), handle=desc.handle
+                                uuid=_uuid_to_bytes(desc.uuid), handle=desc.handle
                             )
                         )
 
                     characteristics.append(
                         BLECharacteristic(
-                            uuid=self._uuid_to_bytes(char.uuid),
+                            uuid=_uuid_to_bytes(char.uuid),
                             handle=char.handle,
                             properties=self._convert_properties(char.properties),
                             descriptors=descriptors,
@@ -222,41 +409,93 @@ class BLEConnection:
 
                 self.services.append(
                     BLEService(
-                        uuid=self._uuid_to_bytes(service.uuid),
+                        uuid=_uuid_to_bytes(service.uuid),
                         handle=service.handle,
                         characteristics=characteristics,
                     )
                 )
 
+            self._build_handle_index()
+            self._cache_services()
+
             self.service_discovery_complete = True
             self.send_service_index = 0  # Start sending services
+            await self._watch_service_changed()
 
             logger.info(
-                f"Discovered {len(self.services)} services for {self.address_str}"
+                "Discovered %d services for %s", len(self.services), self.address_str
             )
             return self.services
 
         except Exception as e:
-            logger.error(f"Service discovery failed for {self.address_str}: {e}")
+            logger.error("Service discovery failed for %s: %s", self.address_str, e)
             raise
 
-    def _uuid_to_bytes(self, uuid_str: str) -> bytes:
-        """Convert UUID string to 16-byte array.
+    def _cache_services(self) -> None:
+        """Store the converted services, evicting the least recently used."""
+        cache = self._SERVICE_CACHE
+        cache[self.address] = self.services
+        cache.move_to_end(self.address)
+        while len(cache) > self._service_cache_size:
+            cache.popitem(last=False)
+
+    async def _watch_service_changed(self) -> None:
+        """Subscribe to Service Changed indications, if the device has them.
+
+        BlueZ usually handles this characteristic itself and hides it, in which
+        case there is nothing to subscribe to.
+        """
+        for service in self._bleak_services:
+            for char in service.characteristics:
+                if char.uuid == _SERVICE_CHANGED_UUID:
+                    try:
+                        await self.client.start_notify(char, self._on_service_changed)
+                    except Exception as e:
+                        logger.debug(
+                            "Cannot watch Service Changed on %s: %s",
+                            self.address_str,
+                            e,
+                        )
+                    return
+
+    def _on_service_changed(self, sender: Any, data: bytearray) -> None:
+        """Drop cached and indexed services after a Service Changed indication.
 
         Args:
-            uuid_str: UUID string
+            sender: Characteristic that sent the indication
+            data: Affected handle range (ignored; the whole table is dropped)
+        """
+        logger.info(
+            "Service Changed indication from %s, dropping cached services",
+            self.address_str,
+        )
+        self.invalidate_service_cache(self.address)
+        self._bleak_services.clear()
+        self._char_by_handle.clear()
+        self._desc_by_handle.clear()
 
-        Returns:
-            bytes: 16-byte UUID
+    @classmethod
+    def resize_service_cache(cls, size: int) -> None:
+        """Set how many devices' services are cached, evicting as needed.
+
+        Args:
+            size: Maximum number of cached devices
         """
-        # Remove hyphens and convert to bytes
-        uuid_hex = uuid_str.replace("-", "")
-        if len(uuid_hex) == 4:  # 16-bit UUID
-            uuid_hex = "0000" + uuid_hex + "00001000800000805f9b34fb"
-        elif len(uuid_hex) == 8:  # 32-bit UUID
-            uuid_hex = uuid_hex + "00001000800000805f9b34fb"
+        cls._service_cache_size = max(1, size)
+        while len(cls._SERVICE_CACHE) > cls._service_cache_size:
+            cls._SERVICE_CACHE.popitem(last=False)
+
+    @classmethod
+    def invalidate_service_cache(cls, address: Optional[int] = None) -> None:
+        """Drop cached services, e.g. after a device's GATT database changed.
 
-        return bytes.fromhex(uuid_hex)
+        Args:
+            address: Device address to invalidate, or None to clear all
+        """
+        if address is None:
+            cls._SERVICE_CACHE.clear()
+        else:
+            cls._SERVICE_CACHE.pop(address, None)
 
     def _convert_properties(self, bleak_properties: List[str]) -> int:
         """Convert bleak properties to ESPHome format.
@@ -268,17 +507,8 @@ class BLEConnection:
             int: Properties as bit flags
         """
         properties = 0
-        prop_map = {
-            "read": 0x02,
-            "write-without-response": 0x04,
-            "write": 0x08,
-            "notify": 0x10,
-            "indicate": 0x20,
-        }
-
         for prop in bleak_properties:
-            if prop in prop_map:
-                properties |= prop_map[prop]
+            properties |= _PROP_MAP.get(prop, 0)
 
         return properties
 
@@ -317,13 +547,19 @@ class BLEConnection:
             # Read value
             value = await self.client.read_gatt_char(char.uuid)
             logger.debug(
-                f"Read {len(value)} bytes from handle {handle} on {self.address_str}"
+                "Read %d bytes from handle %d on %s",
+                len(value),
+                handle,
+                self.address_str,
             )
             return value
 
         except Exception as e:
             logger.error(
-                f"Failed to read characteristic {handle} on {self.address_str}: {e}"
+                "Failed to read characteristic %d on %s: %s",
+                handle,
+                self.address_str,
+                e,
             )
             raise
 
@@ -352,16 +588,35 @@ class BLEConnection:
             # Write value
             await self.client.write_gatt_char(char.uuid, data, response=response)
             logger.debug(
-                f"Wrote {len(data)} bytes to handle {handle} on {self.address_str}"
+                "Wrote %d bytes to handle %d on %s", len(data), handle, self.address_str
             )
             return True
 
         except Exception as e:
             logger.error(
-                f"Failed to write characteristic {handle} on {self.address_str}: {e}"
+                "Failed to write characteristic %d on %s: %s",
+                handle,
+                self.address_str,
+                e,
             )
             return False
 
+    def _build_handle_index(self) -> None:
+        """Index the client's characteristics and descriptors by handle."""
+        self._char_by_handle.clear()
+        self._desc_by_handle.clear()
+
+        if not self._bleak_services:
+            if not self.client:
+                return
+            self._bleak_services = list(self.client.services)
+
+        for service in self._bleak_services:
+            for char in service.characteristics:
+                self._char_by_handle[char.handle] = char
+                for desc in char.descriptors:
+                    self._desc_by_handle[desc.handle] = desc
+
     def _find_characteristic_by_handle(
         self, handle: int
     ) -> Optional[BleakGATTCharacteristic]:
@@ -373,16 +628,12 @@ class BLEConnection:
         Returns:
             Optional[BleakGATTCharacteristic]: Characteristic if found
         """
-        if not self.client:
-            return None
-
-        for service in self.client.services:
-            for char in service.characteristics:
-                if char.handle == handle:
-                    return char
-        return None
+        if not self._char_by_handle:
+            # GATT operation before discover_services(); index what bleak has
+            self._build_handle_index()
+        return self._char_by_handle.get(handle)
 
-    def _find_descriptor_by_handle(self, handle: int):
+    def _find_descriptor_by_handle(self, handle: int) -> Optional[BleakGATTDescriptor]:
         """Find bleak descriptor by handle.
 
         Args:
@@ -391,15 +642,10 @@ class BLEConnection:
         Returns:
             Optional[BleakGATTDescriptor]: Descriptor if found
         """
-        if not self.client:
-            return None
-
-        for service in self.client.services:
-            for char in service.characteristics:
-                for desc in char.descriptors:
-                    if desc.handle == handle:
-                        return desc
-        return None
+        if not self._desc_by_handle:
+            # GATT operation before discover_services(); index what bleak has
+            self._build_handle_index()
+        return self._desc_by_handle.get(handle)
 
     async def read_descriptor(self, handle: int) -> bytes:
         """Read descriptor value.
@@ -422,14 +668,16 @@ class BLEConnection:
             # Read value
             value = await self.client.read_gatt_descriptor(desc.uuid)
             logger.debug(
-                f"Read {len(value)} bytes from descriptor {handle} "
-                f"on {self.address_str}"
+                "Read %d bytes from descriptor %d on %s",
+                len(value),
+                handle,
+                self.address_str,
             )
             return value
 
         except Exception as e:
             logger.error(
-                f"Failed to read descriptor {handle} on {self.address_str}: {e}"
+                "Failed to read descriptor %d on %s: %s", handle, self.address_str, e
             )
             raise
 
@@ -455,14 +703,16 @@ class BLEConnection:
             # Write value
             await self.client.write_gatt_descriptor(desc.uuid, data)
             logger.debug(
-                f"Wrote {len(data)} bytes to descriptor {handle} "
-                f"on {self.address_str}"
+                "Wrote %d bytes to descriptor %d on %s",
+                len(data),
+                handle,
+                self.address_str,
             )
             return True
 
         except Exception as e:
             logger.error(
-                f"Failed to write descriptor {handle} on {self.address_str}: {e}"
+                "Failed to write descriptor %d on %s: %s", handle, self.address_str, e
             )
             return False
 
@@ -487,19 +737,23 @@ class BLEConnection:
             if not char:
                 raise ValueError(f"Characteristic with handle {handle} not found")
 
-            # Start notifications
-            await self.client.start_notify(char.uuid, callback)
+            # Start notifications; bleak also passes the sending characteristic
+            await self.client.start_notify(
+                char.uuid, lambda _sender, data: callback(bytes(data))
+            )
             self.notification_handlers[handle] = callback
 
             logger.debug(
-                f"Started notifications for handle {handle} " f"on {self.address_str}"
+                "Started notifications for handle %d on %s", handle, self.address_str
             )
             return True
 
         except Exception as e:
             logger.error(
-                f"Failed to start notifications for handle {handle} "
-                f"on {self.address_str}: {e}"
+                "Failed to start notifications for handle %d on %s: %s",
+                handle,
+                self.address_str,
+                e,
             )
             return False
 
@@ -512,8 +766,10 @@ class BLEConnection:
         Returns:
             bool: True if notification stopped successfully
         """
-        if not self.is_connected():
-            raise RuntimeError("Device not connected")
+        if self.state != ConnectionState.CONNECTED:
+            # Nothing to stop on the device; just forget the handler
+            self.notification_handlers.pop(handle, None)
+            return True
 
         try:
             # Find characteristic by handle
@@ -529,28 +785,65 @@ class BLEConnection:
                 del self.notification_handlers[handle]
 
             logger.debug(
-                f"Stopped notifications for handle {handle} on {self.address_str}"
+                "Stopped notifications for handle %d on %s", handle, self.address_str
             )
             return True
 
         except Exception as e:
             logger.error(
-                f"Failed to stop notifications for handle {handle} "
-                f"on {self.address_str}: {e}"
+                "Failed to stop notifications for handle %d on %s: %s",
+                handle,
+                self.address_str,
+                e,
             )
             return False
 
+    def _on_bleak_disconnect(self, client: BleakClient) -> None:
+        """Mark the connection down as soon as bleak reports the link lost.
+
+        Keeps ``state`` authoritative so is_connected() need not poll bleak,
+        and schedules the teardown disconnect() would otherwise have done, as
+        disconnect() returns early once the state is DISCONNECTED.
+
+        Args:
+            client: The bleak client that disconnected
+        """
+        if client is self.client and self.state == ConnectionState.CONNECTED:
+            logger.info("Device %s disconnected unexpectedly", self.address_str)
+            self.state = ConnectionState.DISCONNECTED
+            self._link_lost_task = asyncio.create_task(self._on_link_lost())
+
+    async def _on_link_lost(self) -> None:
+        """Clean up after an unexpected disconnect and release the slot."""
+        address = self.address
+        try:
+            pending = self._cancel_pending()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+            self.notification_handlers.clear()
+            self._char_by_handle.clear()
+            self._desc_by_handle.clear()
+            self._bleak_services.clear()
+            self.client = None
+
+            # Notify proxy of disconnection, which frees the connection slot
+            if self.proxy:
+                await self.proxy.on_device_connected(
+                    address, False, 0, "Connection lost"
+                )
+        except Exception as e:
+            logger.error("Error cleaning up lost connection to %012X: %s", address, e)
+
     def is_connected(self) -> bool:
         """Check if device is connected.
 
+        Relies on ``state``, which the bleak disconnect callback keeps current.
+
         Returns:
             bool: True if connected
         """
-        return (
-            self.state == ConnectionState.CONNECTED
-            and self.client
-            and self.client.is_connected
-        )
+        return self.state == ConnectionState.CONNECTED
 
     def get_mtu(self) -> int:
         """Get connection MTU.
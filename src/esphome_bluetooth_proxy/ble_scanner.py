@@ -5,9 +5,11 @@ corresponding to the ESP32 BLE tracker functionality in ESPHome.
 """
 
 import asyncio
+import functools
 import logging
+import struct
 from dataclasses import dataclass
-from typing import Callable, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 from bleak import BleakScanner
 from bleak.backends.device import BLEDevice
@@ -15,16 +17,69 @@ from bleak.backends.scanner import AdvertisementData
 
 logger = logging.getLogger(__name__)
 
+# Maximum raw advertisement data length (31 adv + 31 scan response)
+MAX_ADV_DATA_LEN = 62
 
-@dataclass
+# Window over which repeated advertisements from one device are coalesced.
+# This delay comes before the batcher's own flush timeout, so it adds to it
+COALESCE_INTERVAL_S = 0.05
+
+# AD type followed by a little-endian 16-bit value: the company ID of
+# manufacturer data (0xFF) or the UUID of 16-bit service data (0x16)
+_AD_TYPE_U16 = struct.Struct("<BH")
+
+
+@functools.lru_cache(maxsize=4096)
+def _mac_to_int(address: str) -> int:
+    """Convert a MAC address string to uint64.
+
+    Cached, since the same nearby devices advertise over and over.
+
+    Args:
+        address: MAC address in XX:XX:XX:XX:XX:XX format
+
+    Returns:
+        int: MAC address as uint64
+    """
+    return int(address.replace(":", ""), 16)
+
+
+@functools.lru_cache(maxsize=256)
+def _service_data_header(service_uuid: str) -> bytes:
+    """Build the service data header (AD type 0x16 plus UUID) for a UUID string.
+
+    Args:
+        service_uuid: Service UUID string from bleak
+
+    Returns:
+        bytes: Service data type byte followed by the UUID bytes
+    """
+    # Simplified - assumes a 16-bit UUID, which is the 4 hex digits ending the
+    # first group of a full UUID string (0000XXXX-0000-1000-8000-00805f9b34fb)
+    uuid16 = int(service_uuid[:8].replace("-", "")[-4:], 16)
+    return _AD_TYPE_U16.pack(0x16, uuid16)
+
+
+@dataclass(slots=True)
 class BLEAdvertisement:
     """Raw BLE advertisement data matching ESPHome format."""
 
-    address: int  # 48-bit MAC as uint64
-    rssi: int
-    address_type: int  # Public/Random (0=Public, 1=Random)
-    data: bytes  # Raw advertisement data (max 62 bytes)
-    data_len: int
+    address: int = 0  # 48-bit MAC as uint64
+    rssi: int = 0
+    address_type: int = 0  # Public/Random (0=Public, 1=Random)
+    data: bytes = b""  # Raw advertisement data (max 62 bytes)
+
+    @property
+    def data_len(self) -> int:
+        """Length of the raw advertisement data."""
+        return len(self.data)
+
+    def reset(self) -> None:
+        """Zero all fields so the instance can be reused from a pool."""
+        self.address = 0
+        self.rssi = 0
+        self.address_type = 0
+        self.data = b""
 
 
 class BLEScanner:
@@ -34,17 +89,39 @@ class BLEScanner:
     in the ESPHome C++ implementation.
     """
 
-    def __init__(self, callback: Callable[[BLEAdvertisement], None]):
+    def __init__(
+        self,
+        callback: Callable[[BLEAdvertisement], None],
+        acquire: Optional[Callable[[], BLEAdvertisement]] = None,
+        batch_callback: Optional[Callable[[List[BLEAdvertisement]], None]] = None,
+    ):
         """Initialize BLE scanner.
 
         Args:
             callback: Function to call when advertisement is received
+            acquire: Optional factory returning a (pooled) advertisement to fill
+                in, e.g. AdvertisementBatcher.acquire
+            batch_callback: Optional function receiving each coalesced burst of
+                advertisements in one call; used instead of callback when set
         """
         self.callback = callback
+        self.batch_callback = batch_callback
+        self.acquire = acquire or BLEAdvertisement
         self.scanner: Optional[BleakScanner] = None
         self.scanning = False
+
+        # One BleakScanner per scan mode (True=active), reused across restarts
+        self._scanners: Dict[bool, BleakScanner] = {}
         self.active_scan = False
 
+        # Latest advertisement per device address, processed on a short timer
+        self._pending: Dict[str, Tuple[BLEDevice, AdvertisementData]] = {}
+        self._drain_timer: Optional[asyncio.TimerHandle] = None
+
+        # In-flight scan mode restart, and the mode requested while it runs
+        self._restart_task: Optional[asyncio.Task] = None
+        self._pending_mode: Optional[bool] = None
+
     async def start_scanning(self, active: bool = True) -> None:
         """Start BLE scanning.
 
@@ -56,14 +133,10 @@ class BLEScanner:
             return
 
         self.active_scan = active
-        logger.info(f"Starting BLE scanning (active={active})")
+        logger.info("Starting BLE scanning (active=%s)", active)
 
         try:
-            self.scanner = BleakScanner(
-                detection_callback=self._on_advertisement,
-                scanning_mode="active" if active else "passive",
-            )
-
+            self.scanner = self._get_scanner(active)
             await self.scanner.start()
             self.scanning = True
             logger.info("BLE scanning started successfully")
@@ -72,14 +145,11 @@ class BLEScanner:
             # If passive scanning fails, try active scanning as fallback
             if not active and "passive scanning mode requires" in str(e):
                 logger.warning(
-                    f"Passive scanning failed ({e}), falling back to active scanning"
+                    "Passive scanning failed (%s), falling back to active scanning", e
                 )
                 try:
                     self.active_scan = True
-                    self.scanner = BleakScanner(
-                        detection_callback=self._on_advertisement,
-                        scanning_mode="active",
-                    )
+                    self.scanner = self._get_scanner(True)
                     await self.scanner.start()
                     self.scanning = True
                     logger.info(
@@ -88,13 +158,35 @@ class BLEScanner:
                     return
                 except Exception as fallback_e:
                     logger.error(
-                        f"Fallback to active scanning also failed: {fallback_e}"
+                        "Fallback to active scanning also failed: %s", fallback_e
                     )
                     raise fallback_e
 
-            logger.error(f"Failed to start BLE scanning: {e}")
+            logger.error("Failed to start BLE scanning: %s", e)
             raise
 
+    def _get_scanner(self, active: bool) -> BleakScanner:
+        """Get the scanner for a scan mode, creating it on first use.
+
+        Bleak fixes the scanning mode at construction, so each mode gets its
+        own instance; switching modes toggles between them instead of
+        re-creating (and re-registering) a scanner every time.
+
+        Args:
+            active: Whether to use active scanning
+
+        Returns:
+            BleakScanner: Scanner for the requested mode
+        """
+        scanner = self._scanners.get(active)
+        if scanner is None:
+            scanner = BleakScanner(
+                detection_callback=self._on_advertisement,
+                scanning_mode="active" if active else "passive",
+            )
+            self._scanners[active] = scanner
+        return scanner
+
     async def stop_scanning(self) -> None:
         """Stop BLE scanning."""
         if not self.scanning:
@@ -102,6 +194,12 @@ class BLEScanner:
 
         logger.info("Stopping BLE scanning")
 
+        # Drop advertisements still waiting to be coalesced
+        if self._drain_timer:
+            self._drain_timer.cancel()
+            self._drain_timer = None
+        self._pending.clear()
+
         try:
             if self.scanner:
                 await self.scanner.stop()
@@ -109,7 +207,7 @@ class BLEScanner:
             logger.info("BLE scanning stopped")
 
         except Exception as e:
-            logger.error(f"Error stopping BLE scanning: {e}")
+            logger.error("Error stopping BLE scanning: %s", e)
 
     def set_scan_mode(self, active: bool) -> None:
         """Set scanning mode (active/passive).
@@ -118,88 +216,153 @@ class BLEScanner:
             active: Whether to use active scanning
         """
         if self.active_scan != active:
-            logger.info(f"Changing scan mode to {'active' if active else 'passive'}")
+            logger.info("Changing scan mode to %s", "active" if active else "passive")
             self.active_scan = active
 
+            if self._restart_task and not self._restart_task.done():
+                # Let the running restart apply the latest mode when it finishes
+                self._pending_mode = active
+                return
+
             # Restart scanning with new mode if currently scanning
             if self.scanning:
-                asyncio.create_task(self._restart_scanning())
+                self._restart_task = asyncio.create_task(self._restart_scanning())
 
     async def _restart_scanning(self) -> None:
-        """Restart scanning with current mode."""
-        await self.stop_scanning()
-        await self.start_scanning(self.active_scan)
+        """Restart scanning with current mode.
+
+        Mode changes requested while restarting are coalesced into at most one
+        further restart.
+        """
+        mode = self.active_scan
+        while True:
+            self._pending_mode = None
+            await self.stop_scanning()
+            await self.start_scanning(mode)
+
+            if self._pending_mode is None or self._pending_mode == mode:
+                break
+            mode = self._pending_mode
 
     def _on_advertisement(
         self, device: BLEDevice, advertisement_data: AdvertisementData
     ) -> None:
         """Handle received BLE advertisement.
 
+        Only the latest advertisement per device is kept; they are processed
+        together every COALESCE_INTERVAL_S, so a device advertising many times
+        per window costs one conversion and one callback.
+
+        The window runs before the AdvertisementBatcher sees the advertisement,
+        and the batcher then waits up to its own FLUSH_TIMEOUT_MS unless the
+        batch fills. A quiet device's advertisement can therefore take
+        COALESCE_INTERVAL_S plus the flush timeout (50 + 100 ms) to go out.
+
         Args:
             device: BLE device information
             advertisement_data: Advertisement data
         """
-        try:
-            # Convert MAC address string to uint64
-            mac_parts = device.address.split(":")
-            address = 0
-            for part in mac_parts:
-                address = (address << 8) + int(part, 16)
-
-            # Determine address type (simplified - bleak doesn't always provide this)
-            address_type = (
-                1
-                if device.address.startswith(("4", "5", "6", "7", "C", "D", "E", "F"))
-                else 0
+        self._pending[device.address] = (device, advertisement_data)
+        if self._drain_timer is None:
+            self._drain_timer = asyncio.get_running_loop().call_later(
+                COALESCE_INTERVAL_S, self._drain_pending
             )
 
-            # Combine advertisement and scan response data
-            adv_data = bytearray()
+    def _drain_pending(self) -> None:
+        """Process the coalesced advertisements."""
+        self._drain_timer = None
+        pending = self._pending
+        self._pending = {}
+        convert = self._convert_advertisement
+
+        if self.batch_callback is not None:
+            advertisements = []
+            for device, advertisement_data in pending.values():
+                advertisement = convert(device, advertisement_data)
+                if advertisement is not None:
+                    advertisements.append(advertisement)
+            if advertisements:
+                self.batch_callback(advertisements)
+            return
+
+        for device, advertisement_data in pending.values():
+            advertisement = convert(device, advertisement_data)
+            if advertisement is not None:
+                self.callback(advertisement)
+
+    def _convert_advertisement(
+        self, device: BLEDevice, advertisement_data: AdvertisementData
+    ) -> Optional[BLEAdvertisement]:
+        """Convert a bleak advertisement to the ESPHome raw format.
+
+        Args:
+            device: BLE device information
+            advertisement_data: Advertisement data
+
+        Returns:
+            Optional[BLEAdvertisement]: Filled-in advertisement, or None on error
+        """
+        try:
+            # Convert MAC address string to uint64
+            address = _mac_to_int(device.address)
+
+            # Determine address type: BlueZ reports it in the device properties
+            details = device.details
+            props = details.get("props") if isinstance(details, dict) else None
+            if props and "AddressType" in props:
+                address_type = 1 if props["AddressType"] == "random" else 0
+            else:
+                # Fallback: random static addresses have the top two bits set
+                address_type = 1 if (address >> 40) & 0xC0 == 0xC0 else 0
+
+            # Combine advertisement and scan response data; parts are joined
+            # once at the end instead of growing a bytearray piecemeal. Stop
+            # building once the payload is already past the length limit.
+            parts = []
+            total = 0
 
             # Add manufacturer data
             if advertisement_data.manufacturer_data:
                 for company_id, data in advertisement_data.manufacturer_data.items():
-                    # Add manufacturer data TLV
-                    adv_data.extend([0xFF])  # Manufacturer data type
-                    adv_data.extend(company_id.to_bytes(2, "little"))
-                    adv_data.extend(data)
+                    if total >= MAX_ADV_DATA_LEN:
+                        break
+                    # Manufacturer data type, company ID, data
+                    part = _AD_TYPE_U16.pack(0xFF, company_id) + data
+                    parts.append(part)
+                    total += len(part)
 
             # Add service data
-            if advertisement_data.service_data:
+            if advertisement_data.service_data and total < MAX_ADV_DATA_LEN:
                 for service_uuid, data in advertisement_data.service_data.items():
-                    adv_data.extend([0x16])  # Service data type
-                    # Add UUID (simplified - assumes 16-bit UUID)
-                    if len(service_uuid) == 36:  # Full UUID string
-                        uuid_bytes = bytes.fromhex(service_uuid.replace("-", ""))[:2]
-                    else:
-                        uuid_bytes = bytes.fromhex(service_uuid)[:2]
-                    adv_data.extend(uuid_bytes)
-                    adv_data.extend(data)
+                    if total >= MAX_ADV_DATA_LEN:
+                        break
+                    # Service data type, UUID, data
+                    part = _service_data_header(service_uuid) + data
+                    parts.append(part)
+                    total += len(part)
 
             # Add local name if present
-            if advertisement_data.local_name:
+            if advertisement_data.local_name and total < MAX_ADV_DATA_LEN:
                 name_bytes = advertisement_data.local_name.encode("utf-8")
-                adv_data.extend([0x09, len(name_bytes)])  # Complete local name
-                adv_data.extend(name_bytes)
+                # Complete local name
+                parts.append(bytes((0x09, len(name_bytes))) + name_bytes)
 
             # Ensure data doesn't exceed 62 bytes (31 adv + 31 scan response)
-            if len(adv_data) > 62:
-                adv_data = adv_data[:62]
-
-            # Create advertisement object
-            advertisement = BLEAdvertisement(
-                address=address,
-                rssi=advertisement_data.rssi or -127,
-                address_type=address_type,
-                data=bytes(adv_data),
-                data_len=len(adv_data),
-            )
+            adv_data = b"".join(parts)[:MAX_ADV_DATA_LEN]
 
-            # Call the callback
-            self.callback(advertisement)
+            # Fill in a (possibly pooled) advertisement object
+            advertisement = self.acquire()
+            advertisement.address = address
+            advertisement.rssi = advertisement_data.rssi or -127
+            advertisement.address_type = address_type
+            advertisement.data = adv_data
+            return advertisement
 
         except Exception as e:
-            logger.error(f"Error processing advertisement from {device.address}: {e}")
+            logger.error(
+                "Error processing advertisement from %s: %s", device.address, e
+            )
+            return None
 
     def is_scanning(self) -> bool:
         """Check if scanner is currently active."""
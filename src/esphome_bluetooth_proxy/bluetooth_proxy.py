@@ -6,21 +6,35 @@ ESPHome C++ implementation.
 """
 
 import asyncio
+import itertools
 import logging
-from typing import TYPE_CHECKING, Dict, List, Optional
+from collections import deque
+from contextlib import suppress
+from typing import TYPE_CHECKING, Deque, Dict, List, Optional, Tuple
 
 from .advertisement_batcher import AdvertisementBatcher
-from .ble_connection import BLEConnection
+from .ble_connection import SERVICE_CACHE_PER_SLOT, BLEConnection
 from .ble_scanner import BLEAdvertisement, BLEScanner
 from .connection import APIConnection
 from .gatt_operations import GATTOperationHandler
-from .protocol import BluetoothScannerStateResponse, MessageType
+from .protocol import (
+    BluetoothDeviceConnectionResponse,
+    BluetoothScannerStateResponse,
+    MessageEncoder,
+    MessageType,
+)
 
 if TYPE_CHECKING:
     from .api_server import ESPHomeAPIServer
 
 logger = logging.getLogger(__name__)
 
+# Advertisement frames buffered per API connection before the oldest is dropped
+ADV_QUEUE_MAXSIZE = 64
+
+# How long connect_device waits for a connection slot to free up
+CONNECT_SLOT_TIMEOUT_S = 5.0
+
 
 class BluetoothProxy:
     """Main Bluetooth proxy coordinator.
@@ -30,6 +44,28 @@ class BluetoothProxy:
     connections, and GATT operations.
     """
 
+    __slots__ = (
+        "api_server",
+        "max_connections",
+        "scanner",
+        "advertisement_batcher",
+        "scanning_enabled",
+        "connections",
+        "_free_connections",
+        "_slot_waiters",
+        "_pending_connects",
+        "encoder",
+        "gatt_handler",
+        "subscribed_connections",
+        "_subscriber_ids",
+        "_bt_ready",
+        "_adv_writers",
+        "_ready_queues",
+        "active",
+        "running",
+        "_loop",
+    )
+
     def __init__(self, api_server: "ESPHomeAPIServer", max_connections: int = 3):
         """Initialize Bluetooth proxy.
 
@@ -47,19 +83,41 @@ class BluetoothProxy:
 
         # Connection management
         self.connections: Dict[int, BLEConnection] = {}  # address -> connection
-        self.connection_pool: List[BLEConnection] = []
+        # Idle connection slots, taken on connect and returned on disconnect
+        self._free_connections: Deque[BLEConnection] = deque()
+        # connect_device calls waiting for a slot, served first come first served
+        self._slot_waiters: Deque["asyncio.Future[Optional[BLEConnection]]"] = deque()
+        # Connects queued behind busy slots, keyed by device address
+        self._pending_connects: Dict[int, asyncio.Task] = {}
+
+        # Encoder for proxy-originated messages
+        self.encoder = MessageEncoder()
 
         # GATT operations handler
         self.gatt_handler = GATTOperationHandler(self)
 
         # API connection tracking
-        self.subscribed_connections: List[APIConnection] = []
+        # Keyed by subscriber ID for O(1) membership while keeping subscription
+        # order; IDs come from a counter so they are never reused
+        self.subscribed_connections: Dict[int, APIConnection] = {}
+        self._subscriber_ids = itertools.count(1)
+        # Subscribed connections currently able to receive advertisements,
+        # maintained by _on_bt_subscription_changed
+        self._bt_ready: List[APIConnection] = []
+        # Subscriber ID -> (frame queue, writer task) per subscription
+        self._adv_writers: Dict[
+            int, Tuple["asyncio.Queue[List[bytes]]", asyncio.Task]
+        ] = {}
+        # Writer queues of _bt_ready, parallel to it, iterated per batch
+        self._ready_queues: List["asyncio.Queue[List[bytes]]"] = []
 
         # State
         self.active = False
         self.running = False
+        # Event loop the proxy runs on, set by start()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
 
-        logger.info(f"Bluetooth proxy initialized (max_connections={max_connections})")
+        logger.info("Bluetooth proxy initialized (max_connections=%d)", max_connections)
 
     async def start(self) -> None:
         """Start the Bluetooth proxy."""
@@ -68,29 +126,43 @@ class BluetoothProxy:
             return
 
         logger.info("Starting Bluetooth proxy")
+        self._loop = asyncio.get_running_loop()
 
         try:
-            # Initialize scanner
-            self.scanner = BLEScanner(callback=self._on_advertisement)
-
             # Initialize advertisement batcher
             self.advertisement_batcher = AdvertisementBatcher(
                 send_callback=self._send_advertisement_batch
             )
 
+            # Initialize scanner, filling in advertisements rented from the pool
+            self.scanner = BLEScanner(
+                callback=self._on_advertisement,
+                acquire=self.advertisement_batcher.acquire,
+                batch_callback=self._on_advertisements,
+            )
+
             # Initialize connection pool
             self._initialize_connection_pool()
 
-            # Start BLE scanning
-            await self._start_scanning()
+            # Scanning starts with the first API subscription, not here
 
             self.running = True
             logger.info("Bluetooth proxy started successfully")
 
         except Exception as e:
-            logger.error(f"Failed to start Bluetooth proxy: {e}")
+            logger.error("Failed to start Bluetooth proxy: %s", e)
             raise
 
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the loop captured by start(), or the running loop before then.
+
+        Returns:
+            asyncio.AbstractEventLoop: Event loop to schedule proxy tasks on
+        """
+        if self._loop is None:
+            return asyncio.get_running_loop()
+        return self._loop
+
     async def stop(self) -> None:
         """Stop the Bluetooth proxy."""
         if not self.running:
@@ -98,40 +170,68 @@ class BluetoothProxy:
 
         logger.info("Stopping Bluetooth proxy")
 
-        try:
-            # Stop scanning
-            if self.scanner and self.scanner.is_scanning():
-                await self.scanner.stop_scanning()
-
-            # Disconnect all devices
-            disconnect_tasks = []
-            for connection in self.connections.values():
-                if connection.is_connected():
-                    disconnect_tasks.append(connection.disconnect())
-
-            if disconnect_tasks:
-                await asyncio.gather(*disconnect_tasks, return_exceptions=True)
+        # Turn away connect_device calls still waiting for a slot, so slots
+        # released by the disconnects below are not handed out again
+        while self._slot_waiters:
+            waiter = self._slot_waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+        if self._pending_connects:
+            await asyncio.gather(
+                *self._pending_connects.values(), return_exceptions=True
+            )
 
-            # Clear state
-            self.connections.clear()
-            self.subscribed_connections.clear()
+        # Stop scanning; stop_scanning() logs its own errors and a failure
+        # must not keep devices connected
+        if self.scanner and self.scanner.is_scanning():
+            with suppress(Exception):
+                await self.scanner.stop_scanning()
 
-            self.running = False
-            logger.info("Bluetooth proxy stopped")
+        # Disconnect all devices
+        disconnect_tasks = [
+            connection.disconnect()
+            for connection in self.connections.values()
+            if connection.is_connected()
+        ]
+        if len(disconnect_tasks) == 1:
+            # Common single-device case; skip gather's wrapping and bookkeeping
+            try:
+                await disconnect_tasks[0]
+            except Exception as e:
+                logger.error("Error disconnecting device: %s", e)
+        elif disconnect_tasks:
+            await asyncio.gather(*disconnect_tasks, return_exceptions=True)
+
+        # Clear state
+        self.connections.clear()
+        for api_connection in self.subscribed_connections.values():
+            api_connection.on_bluetooth_subscription_changed = None
+            api_connection.bluetooth_subscriber_id = None
+        self.subscribed_connections.clear()
+        self._bt_ready.clear()
+        self._ready_queues = []
+        writers = [writer for _, writer in self._adv_writers.values()]
+        self._adv_writers.clear()
+        for writer in writers:
+            writer.cancel()
+        if writers:
+            await asyncio.gather(*writers, return_exceptions=True)
 
-        except Exception as e:
-            logger.error(f"Error stopping Bluetooth proxy: {e}")
+        self.running = False
+        logger.info("Bluetooth proxy stopped")
 
     def _initialize_connection_pool(self) -> None:
         """Initialize the BLE connection pool."""
-        self.connection_pool = []
-        for i in range(self.max_connections):
-            # Create placeholder connections (will be assigned addresses when needed)
-            connection = BLEConnection(0, 0, self)
-            self.connection_pool.append(connection)
+        # Create placeholder connections (will be assigned addresses when needed)
+        self._free_connections = deque(
+            BLEConnection(0, 0, self) for _ in range(self.max_connections)
+        )
+        BLEConnection.resize_service_cache(
+            self.max_connections * SERVICE_CACHE_PER_SLOT
+        )
 
         logger.debug(
-            f"Initialized connection pool with {len(self.connection_pool)} slots"
+            "Initialized connection pool with %d slots", len(self._free_connections)
         )
 
     async def subscribe_api_connection(
@@ -143,16 +243,30 @@ class BluetoothProxy:
             api_connection: API connection to subscribe
             flags: Subscription flags
         """
-        if api_connection not in self.subscribed_connections:
-            self.subscribed_connections.append(api_connection)
+        if api_connection.bluetooth_subscriber_id is None:
+            key = next(self._subscriber_ids)
+            api_connection.bluetooth_subscriber_id = key
+            self.subscribed_connections[key] = api_connection
+            api_connection.on_bluetooth_subscription_changed = (
+                self._on_bt_subscription_changed
+            )
+            queue: "asyncio.Queue[List[bytes]]" = asyncio.Queue(ADV_QUEUE_MAXSIZE)
+            self._adv_writers[key] = (
+                queue,
+                self._get_loop().create_task(self._adv_writer(api_connection, queue)),
+            )
+            if api_connection.is_bluetooth_subscribed():
+                self._bt_ready.append(api_connection)
+                self._refresh_ready_queues()
             logger.info(
-                f"Subscribed API connection {api_connection} to Bluetooth events "
-                f"(flags=0x{flags:08X})"
+                "Subscribed API connection %s to Bluetooth events (flags=0x%08X)",
+                api_connection,
+                flags,
             )
 
             # Send current scanner state to new subscription
             if api_connection.subscribed_to_states:
-                asyncio.create_task(self._send_scanner_state(api_connection))
+                self._get_loop().create_task(self._send_scanner_state(api_connection))
 
             # Start scanning if this is the first subscription
             if len(self.subscribed_connections) == 1 and not self.scanning_enabled:
@@ -164,12 +278,20 @@ class BluetoothProxy:
         Args:
             api_connection: API connection to unsubscribe
         """
-        if api_connection not in self.subscribed_connections:
-            logger.warning(f"API connection {api_connection} not subscribed")
+        key = api_connection.bluetooth_subscriber_id
+        if key is None:
+            logger.warning("API connection %s not subscribed", api_connection)
             return
 
-        self.subscribed_connections.remove(api_connection)
-        logger.info(f"Unsubscribed API connection {api_connection}")
+        api_connection.bluetooth_subscriber_id = None
+        del self.subscribed_connections[key]
+        api_connection.on_bluetooth_subscription_changed = None
+        _, writer = self._adv_writers.pop(key)
+        if api_connection in self._bt_ready:
+            self._bt_ready.remove(api_connection)
+            self._refresh_ready_queues()
+        writer.cancel()
+        logger.info("Unsubscribed API connection %s", api_connection)
 
         # Stop scanning if no more subscriptions
         if len(self.subscribed_connections) == 0 and self.scanning_enabled:
@@ -194,7 +316,7 @@ class BluetoothProxy:
             await self._notify_scanner_state_change()
 
         except Exception as e:
-            logger.error(f"Error starting BLE scanning: {e}")
+            logger.error("Error starting BLE scanning: %s", e)
 
     async def _stop_scanning(self) -> None:
         """Stop BLE scanning."""
@@ -217,7 +339,34 @@ class BluetoothProxy:
             await self._notify_scanner_state_change()
 
         except Exception as e:
-            logger.error(f"Error stopping BLE scanning: {e}")
+            logger.error("Error stopping BLE scanning: %s", e)
+
+    def _on_bt_subscription_changed(
+        self, api_connection: APIConnection, subscribed: bool
+    ) -> None:
+        """Track which subscribed API connections can receive advertisements.
+
+        Args:
+            api_connection: API connection whose state changed
+            subscribed: Whether it now accepts Bluetooth events
+        """
+        if subscribed:
+            if api_connection in self._bt_ready:
+                return
+            self._bt_ready.append(api_connection)
+        elif api_connection in self._bt_ready:
+            self._bt_ready.remove(api_connection)
+        else:
+            return
+        self._refresh_ready_queues()
+
+    def _refresh_ready_queues(self) -> None:
+        """Rebuild the writer queues of _bt_ready, in the same order."""
+        writers = self._adv_writers
+        self._ready_queues = [
+            writers[api_connection.bluetooth_subscriber_id][0]
+            for api_connection in self._bt_ready
+        ]
 
     def _on_advertisement(self, advertisement: BLEAdvertisement) -> None:
         """Handle received BLE advertisement.
@@ -225,94 +374,230 @@ class BluetoothProxy:
         Args:
             advertisement: Received BLE advertisement
         """
-        if not self.advertisement_batcher:
+        batcher = self.advertisement_batcher
+        if batcher is None:
+            return
+
+        if not self._bt_ready:
+            # No client to send to; don't batch, just return it to the pool
+            batcher.release(advertisement)
             return
 
         # Add to batch for efficient transmission
-        self.advertisement_batcher.add_advertisement(advertisement)
+        batcher.add_advertisement(advertisement)
+
+    def _on_advertisements(self, advertisements: List[BLEAdvertisement]) -> None:
+        """Handle a burst of received BLE advertisements.
+
+        Args:
+            advertisements: Received BLE advertisements
+        """
+        batcher = self.advertisement_batcher
+        if batcher is None:
+            return
+
+        if not self._bt_ready:
+            # No client to send to; don't batch, just return them to the pool
+            for advertisement in advertisements:
+                batcher.release(advertisement)
+            return
 
-    def _send_advertisement_batch(self, advertisements: List[BLEAdvertisement]):
-        """Send batch of advertisements to subscribed connections.
+        batcher.add_advertisements(advertisements)
+
+    def _send_advertisement_batch(self, frame: List[bytes]):
+        """Send serialized advertisement batch to subscribed connections.
 
         Args:
-            advertisements: List of advertisements to send
+            frame: Frame chunks from AdvertisementBatcher.serialize_batch
         """
+        if not self._bt_ready:
+            return
+
         logger.debug(
-            f"Sending advertisement batch ({len(advertisements)} advertisements) "
-            f"to {len(self.subscribed_connections)} connections"
+            "Sending advertisement batch (%d advertisements) to %d connections",
+            len(frame) - 1,
+            len(self._bt_ready),
         )
 
-        # Send advertisements to subscribed API connections
-        for api_connection in self.subscribed_connections:
-            if api_connection.is_bluetooth_subscribed():
-                asyncio.create_task(
-                    api_connection.send_bluetooth_le_advertisements(advertisements)
-                )
+        # Hand the frame to each connection's writer task
+        for queue in self._ready_queues:
+            if queue.full():
+                # Client is not keeping up; drop its oldest frame
+                queue.get_nowait()
+            queue.put_nowait(frame)
+
+    async def _adv_writer(
+        self, api_connection: APIConnection, queue: "asyncio.Queue[List[bytes]]"
+    ) -> None:
+        """Write queued advertisement frames to one API connection, in order.
+
+        Args:
+            api_connection: API connection to write to
+            queue: Frames queued by _send_advertisement_batch
+        """
+        while True:
+            frame = await queue.get()
+            await api_connection.send_bluetooth_le_advertisements(frame)
+
+    def _build_scanner_state(self) -> Tuple[BluetoothScannerStateResponse, bytes]:
+        """Build the current scanner state response.
 
-    async def _send_scanner_state(self, api_connection: APIConnection) -> None:
+        Returns:
+            Tuple[BluetoothScannerStateResponse, bytes]: Message and its encoding
+        """
+        scanner_state = BluetoothScannerStateResponse(
+            active=self.active,  # Whether active connections are enabled
+            scanning=(
+                self.scanner.is_scanning() if self.scanner else False
+            ),  # Current scanning state
+            mode=(
+                1 if self.scanner and self.scanner.get_scan_mode() else 0
+            ),  # 0=Classic, 1=BLE
+        )
+        return (
+            scanner_state,
+            self.encoder.encode_bluetooth_scanner_state_response(scanner_state),
+        )
+
+    async def _send_scanner_state(
+        self,
+        api_connection: APIConnection,
+        state: Optional[Tuple[BluetoothScannerStateResponse, bytes]] = None,
+    ) -> None:
         """Send scanner state to API connection.
 
         Args:
             api_connection: API connection to send state to
+            state: Prebuilt result of _build_scanner_state, shared when
+                notifying several connections
         """
         # Only send state if the connection is subscribed to states
         if not api_connection.subscribed_to_states:
             return
 
         try:
-            # Create scanner state response message
-            scanner_state = BluetoothScannerStateResponse(
-                active=self.active,  # Whether active connections are enabled
-                scanning=(
-                    self.scanner.is_scanning() if self.scanner else False
-                ),  # Current scanning state
-                mode=(
-                    1 if self.scanner and self.scanner.get_scan_mode() else 0
-                ),  # 0=Classic, 1=BLE
-            )
+            scanner_state, payload = state or self._build_scanner_state()
 
             # Send scanner state response
             await api_connection.send_message(
-                MessageType.BLUETOOTH_SCANNER_STATE_RESPONSE,
-                api_connection.encoder.encode_bluetooth_scanner_state_response(
-                    scanner_state
-                ),
+                MessageType.BLUETOOTH_SCANNER_STATE_RESPONSE, payload
             )
 
             logger.debug(
-                f"Sent scanner state to {api_connection}: "
-                f"active={scanner_state.active}, "
-                f"scanning={scanner_state.scanning}, "
-                f"mode={scanner_state.mode}"
+                "Sent scanner state to %s: active=%s, scanning=%s, mode=%d",
+                api_connection,
+                scanner_state.active,
+                scanner_state.scanning,
+                scanner_state.mode,
             )
         except Exception as e:
-            logger.error(f"Error sending scanner state to {api_connection}: {e}")
-
-    async def connect_device(self, address: int, address_type: int) -> bool:
+            logger.error("Error sending scanner state to %s: %s", api_connection, e)
+
+    async def connect_device(
+        self,
+        address: int,
+        address_type: int,
+        api_connection: Optional[APIConnection] = None,
+    ) -> bool:
         """Connect to a BLE device.
 
+        When all slots are busy the connect is queued in the background, so
+        the caller's message loop is not held up; if no slot frees up in time
+        the failure is reported to api_connection.
+
         Args:
             address: Device MAC address as uint64
             address_type: Address type (0=Public, 1=Random)
+            api_connection: API connection that requested the connect
 
         Returns:
-            bool: True if connection initiated successfully
+            bool: True if connection initiated or queued successfully
         """
-        if address in self.connections:
-            logger.warning(f"Device {address:012X} already connected or connecting")
+        if address in self.connections or address in self._pending_connects:
+            logger.warning("Device %012X already connected or connecting", address)
             return False
 
-        # Find available connection slot
-        available_connection = None
-        for connection in self.connection_pool:
-            if not connection.is_connected() and connection.address == 0:
-                available_connection = connection
-                break
+        try:
+            available_connection = self._free_connections.popleft()
+        except IndexError:
+            self._pending_connects[address] = self._get_loop().create_task(
+                self._connect_when_free(address, address_type, api_connection)
+            )
+            return True
 
-        if not available_connection:
-            logger.warning(f"No available connection slots for device {address:012X}")
-            return False
+        self._start_connect(available_connection, address, address_type)
+        return True
 
+    async def _connect_when_free(
+        self,
+        address: int,
+        address_type: int,
+        api_connection: Optional[APIConnection],
+    ) -> None:
+        """Wait for a connection slot, then connect to the device.
+
+        Args:
+            address: Device MAC address as uint64
+            address_type: Address type (0=Public, 1=Random)
+            api_connection: API connection to report a failure to
+        """
+        try:
+            # A slot may have been returned to the pool before this task ran
+            if self._free_connections:
+                slot: Optional[BLEConnection] = self._free_connections.popleft()
+            else:
+                slot = await self._wait_for_slot(address)
+        finally:
+            self._pending_connects.pop(address, None)
+
+        if slot is None:
+            await self._send_connect_failure(api_connection, address)
+            return
+
+        # Another request may have taken this device while we waited
+        if address in self.connections:
+            self._release_slot(slot)
+            logger.warning("Device %012X already connected or connecting", address)
+            await self._send_connect_failure(api_connection, address)
+            return
+
+        self._start_connect(slot, address, address_type)
+
+    async def _send_connect_failure(
+        self, api_connection: Optional[APIConnection], address: int
+    ) -> None:
+        """Tell an API connection that its connect request failed.
+
+        Args:
+            api_connection: API connection that requested the connect
+            address: Device MAC address as uint64
+        """
+        if api_connection is None:
+            return
+
+        try:
+            response = BluetoothDeviceConnectionResponse(
+                address=address,
+                connected=False,
+                error=1,  # Generic error
+            )
+            payload = self.encoder.encode_bluetooth_device_connection_response(response)
+            await api_connection.send_message(
+                MessageType.BLUETOOTH_DEVICE_CONNECTION_RESPONSE, payload
+            )
+        except Exception as e:
+            logger.error("Error sending connection failure for %012X: %s", address, e)
+
+    def _start_connect(
+        self, available_connection: BLEConnection, address: int, address_type: int
+    ) -> None:
+        """Assign a connection slot to a device and start connecting.
+
+        Args:
+            available_connection: Free connection slot
+            address: Device MAC address as uint64
+            address_type: Address type (0=Public, 1=Random)
+        """
         # Configure connection for this device
         available_connection.address = address
         available_connection.address_type = address_type
@@ -324,10 +609,8 @@ class BluetoothProxy:
         self.connections[address] = available_connection
 
         # Start connection
-        logger.info(f"Initiating connection to device {address:012X}")
-        asyncio.create_task(available_connection.connect())
-
-        return True
+        logger.info("Initiating connection to device %012X", address)
+        self._get_loop().create_task(available_connection.connect())
 
     async def disconnect_device(self, address: int) -> bool:
         """Disconnect from a BLE device.
@@ -338,15 +621,21 @@ class BluetoothProxy:
         Returns:
             bool: True if disconnection initiated successfully
         """
+        pending = self._pending_connects.pop(address, None)
+        if pending is not None:
+            # Still waiting for a slot; give up on the queued connect
+            pending.cancel()
+            return True
+
         if address not in self.connections:
-            logger.warning(f"Device {address:012X} not connected")
+            logger.warning("Device %012X not connected", address)
             return False
 
         connection = self.connections[address]
-        logger.info(f"Initiating disconnection from device {address:012X}")
+        logger.info("Initiating disconnection from device %012X", address)
 
         # Start disconnection
-        asyncio.create_task(connection.disconnect())
+        self._get_loop().create_task(connection.disconnect())
 
         return True
 
@@ -362,7 +651,10 @@ class BluetoothProxy:
             error: Error message (if connection failed)
         """
         logger.info(
-            f"Device {address:012X} connection state: connected={connected} MTU={mtu}"
+            "Device %012X connection state: connected=%s MTU=%d",
+            address,
+            connected,
+            mtu,
         )
 
         if not connected:
@@ -372,20 +664,62 @@ class BluetoothProxy:
                 del self.connections[address]
 
                 # Reset connection for reuse
-                connection.address = 0
-                connection.address_type = 0
-                connection.address_str = ""
+                connection.reset()
+                self._release_slot(connection)
 
         # TODO: Send connection state to subscribed API connections
         # This will be implemented when we add the protobuf messages
 
+    async def _wait_for_slot(self, address: int) -> Optional[BLEConnection]:
+        """Wait up to CONNECT_SLOT_TIMEOUT_S for a connection slot to be released.
+
+        Args:
+            address: Device MAC address, for logging
+
+        Returns:
+            Optional[BLEConnection]: Released connection slot, or None if none
+                became available
+        """
+        waiter: "asyncio.Future[Optional[BLEConnection]]" = (
+            self._get_loop().create_future()
+        )
+        self._slot_waiters.append(waiter)
+        try:
+            slot = await asyncio.wait_for(waiter, CONNECT_SLOT_TIMEOUT_S)
+        except asyncio.TimeoutError:
+            with suppress(ValueError):
+                self._slot_waiters.remove(waiter)
+            slot = None
+        except asyncio.CancelledError:
+            # Pass on a slot that was handed to us just before cancellation
+            if waiter.done() and not waiter.cancelled() and waiter.result():
+                self._release_slot(waiter.result())
+            raise
+
+        if slot is None:
+            logger.warning("No available connection slots for device %012X", address)
+        return slot
+
+    def _release_slot(self, connection: BLEConnection) -> None:
+        """Hand a free connection slot to the next waiter, or back to the pool.
+
+        Args:
+            connection: Connection slot that is no longer in use
+        """
+        while self._slot_waiters:
+            waiter = self._slot_waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(connection)
+                return
+        self._free_connections.append(connection)
+
     def get_free_connections(self) -> int:
         """Get number of free connection slots.
 
         Returns:
             int: Number of available connection slots
         """
-        return self.max_connections - len(self.connections)
+        return len(self._free_connections)
 
     def get_connection_limit(self) -> int:
         """Get maximum number of connections.
@@ -404,10 +738,10 @@ class BluetoothProxy:
         if self.active != active:
             self.active = active
             self.api_server.set_active_connections(active)
-            logger.info(f"Active connections {'enabled' if active else 'disabled'}")
+            logger.info("Active connections %s", "enabled" if active else "disabled")
 
             # Notify all subscribed connections about state change
-            asyncio.create_task(self._notify_scanner_state_change())
+            self._get_loop().create_task(self._notify_scanner_state_change())
 
     def has_active(self) -> bool:
         """Check if active connections are supported.
@@ -425,22 +759,25 @@ class BluetoothProxy:
         """
         if self.scanner:
             self.scanner.set_scan_mode(active)
-            logger.info(f"Scanner mode set to {'active' if active else 'passive'}")
+            logger.info("Scanner mode set to %s", "active" if active else "passive")
 
             # Notify all subscribed connections about state change
             await self._notify_scanner_state_change()
 
     async def _notify_scanner_state_change(self) -> None:
         """Notify all subscribed connections about scanner state changes."""
-        tasks = []
-        for api_connection in self.subscribed_connections:
-            if api_connection.subscribed_to_states:
-                tasks.append(self._send_scanner_state(api_connection))
+        # The state is the same for everyone, so encode it once
+        state = self._build_scanner_state()
+        tasks = [
+            self._send_scanner_state(api_connection, state)
+            for api_connection in self.subscribed_connections.values()
+            if api_connection.subscribed_to_states
+        ]
 
         if tasks:
             await asyncio.gather(*tasks, return_exceptions=True)
             logger.debug(
-                f"Notified {len(tasks)} connections about scanner state change"
+                "Notified %d connections about scanner state change", len(tasks)
             )
 
     def get_stats(self) -> dict:
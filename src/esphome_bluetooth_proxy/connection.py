@@ -8,29 +8,42 @@ import asyncio
 import logging
 from asyncio import StreamReader, StreamWriter
 from enum import IntEnum
-from typing import Callable, Optional
+from typing import Awaitable, Callable, Dict, Optional, Tuple
 
 from .protocol import (
     BluetoothDeviceConnectionResponse,
     BluetoothGATTGetServicesResponse,
     BluetoothGATTService,
-    BluetoothLEAdvertisementResponse,
-    BluetoothLERawAdvertisementsResponse,
     BluetoothScannerStateResponse,
     ConnectResponse,
     DeviceInfoResponse,
     HelloResponse,
+    IncompleteFrameError,
     ListEntitiesDoneResponse,
     MessageDecoder,
     MessageEncoder,
     MessageType,
     ProtocolError,
+    create_frame_header,
     create_message_frame,
-    parse_message_frame,
+    parse_frame_header,
 )
 
 logger = logging.getLogger(__name__)
 
+# The HelloResponse never changes, so its frame is built once at import
+_HELLO_RESPONSE_FRAME = create_message_frame(
+    MessageType.HELLO_RESPONSE,
+    MessageEncoder().encode_hello_response(
+        HelloResponse(
+            api_version_major=1,
+            api_version_minor=10,
+            server_info="ESPHome Python Bluetooth Proxy v0.1.0",
+            name="python-bluetooth-proxy",
+        )
+    ),
+)
+
 
 class ConnectionState(IntEnum):
     """Connection state enumeration."""
@@ -43,12 +56,37 @@ class ConnectionState(IntEnum):
 class APIConnection:
     """Manages individual API client connections."""
 
+    __slots__ = (
+        "reader",
+        "writer",
+        "device_info_provider",
+        "password",
+        "on_authenticated",
+        "bluetooth_subscriber_id",
+        "on_bluetooth_subscription_changed",
+        "state",
+        "client_info",
+        "client_api_version_major",
+        "client_api_version_minor",
+        "subscribed_to_states",
+        "encoder",
+        "decoder",
+        "client_address",
+        # Attached by the API server / proxy after construction, if available
+        "gatt_handler",
+        "bluetooth_proxy",
+    )
+
+    # Last device info sent and its encoding, shared by all connections
+    _device_info_cache: Optional[Tuple[DeviceInfoResponse, bytes]] = None
+
     def __init__(
         self,
         reader: StreamReader,
         writer: StreamWriter,
         device_info_provider: Callable[[], DeviceInfoResponse],
         password: Optional[str] = None,
+        on_authenticated: Optional[Callable[["APIConnection"], None]] = None,
     ):
         """Initialize API connection.
 
@@ -57,11 +95,20 @@ class APIConnection:
             writer: Async stream writer
             device_info_provider: Function to get device info
             password: Optional API password for authentication
+            on_authenticated: Optional function called once the client has
+                authenticated
         """
         self.reader = reader
         self.writer = writer
         self.device_info_provider = device_info_provider
         self.password = password
+        self.on_authenticated = on_authenticated
+        # Set by BluetoothProxy while subscribed; the hook is called with the
+        # new value whenever is_bluetooth_subscribed() flips
+        self.bluetooth_subscriber_id: Optional[int] = None
+        self.on_bluetooth_subscription_changed: Optional[
+            Callable[["APIConnection", bool], None]
+        ] = None
 
         self.state = ConnectionState.CONNECTING
         self.client_info = ""
@@ -76,111 +123,96 @@ class APIConnection:
         peername = writer.get_extra_info("peername")
         self.client_address = f"{peername[0]}:{peername[1]}" if peername else "unknown"
 
-        logger.info(f"New connection from {self.client_address}")
+        logger.info("New connection from %s", self.client_address)
 
     async def handle_connection(self) -> None:
         """Handle the complete connection lifecycle."""
         try:
             await self._handle_messages()
         except Exception as e:
-            logger.error(f"Connection {self.client_address} error: {e}")
+            logger.error("Connection %s error: %s", self.client_address, e)
         finally:
             await self.close()
 
     async def _handle_messages(self) -> None:
         """Handle incoming messages from the client."""
-        buffer = bytearray()
-
         while not self.writer.is_closing():
             try:
-                # Read data from client
-                data = await asyncio.wait_for(self.reader.read(4096), timeout=30.0)
-                if not data:
-                    logger.info(f"Client {self.client_address} disconnected")
-                    break
+                msg_type, payload = await asyncio.wait_for(
+                    self._read_frame(), timeout=30.0
+                )
+            except asyncio.IncompleteReadError:
+                logger.info("Client %s disconnected", self.client_address)
+                break
+            except asyncio.TimeoutError:
+                logger.warning("Connection %s timed out", self.client_address)
+                break
+            except ProtocolError as e:
+                logger.error("Protocol error from %s: %s", self.client_address, e)
+                return
+            except Exception as e:
+                logger.error("Error reading from %s: %s", self.client_address, e)
+                break
 
-                buffer.extend(data)
+            await self._handle_message(msg_type, payload)
 
-                # Process complete messages from buffer
-                while len(buffer) >= 3:  # Minimum frame size
-                    try:
-                        msg_type, payload, frame_size = parse_message_frame(
-                            bytes(buffer)
-                        )
+    async def _read_frame(self) -> Tuple[int, bytes]:
+        """Read one frame straight from the stream reader.
 
-                        # Remove processed frame from buffer
-                        buffer = buffer[frame_size:]
+        Frames are ``0x00 <varint size> <varint type> <payload>``. The header is
+        read with readexactly(3), which covers it whenever both varints fit in
+        a single byte, and the payload with one readexactly() of its size.
 
-                        # Handle the message
-                        await self._handle_message(msg_type, payload)
+        Returns:
+            Tuple[int, bytes]: (message_type, payload)
+        """
+        header = await self.reader.readexactly(3)
+        if header[0] != 0x00:
+            raise ProtocolError("Invalid frame start marker")
+
+        if header[1] < 0x80 and header[2] < 0x80:
+            payload_size, msg_type = header[1], header[2]
+        else:
+            # Multi-byte varints: read on until both are complete
+            buffer = bytearray(header)
+            while True:
+                try:
+                    msg_type, payload_size, _ = parse_frame_header(buffer)
+                    break
+                except IncompleteFrameError:
+                    buffer += await self.reader.readexactly(1)
 
-                    except ProtocolError as e:
-                        if "Incomplete message frame" in str(e):
-                            # Need more data
-                            break
-                        else:
-                            logger.error(
-                                f"Protocol error from {self.client_address}: {e}"
-                            )
-                            return
-
-            except asyncio.TimeoutError:
-                logger.warning(f"Connection {self.client_address} timed out")
-                break
-            except Exception as e:
-                logger.error(f"Error reading from {self.client_address}: {e}")
-                break
+        payload = await self.reader.readexactly(payload_size) if payload_size else b""
+        return msg_type, payload
 
     async def _handle_message(self, msg_type: int, payload: bytes) -> None:
         """Handle a single message from the client."""
-        logger.info(f"Received message type {msg_type} from {self.client_address}")
+        logger.info("Received message type %s from %s", msg_type, self.client_address)
 
-        try:
-            if msg_type == MessageType.HELLO_REQUEST:
-                await self._handle_hello_request(payload)
-            elif msg_type == MessageType.CONNECT_REQUEST:
-                await self._handle_connect_request(payload)
-            elif msg_type == MessageType.DISCONNECT_REQUEST:
-                await self._handle_disconnect_request(payload)
-            elif msg_type == MessageType.DEVICE_INFO_REQUEST:
-                await self._handle_device_info_request(payload)
-            elif msg_type == MessageType.LIST_ENTITIES_REQUEST:
-                await self._handle_list_entities_request(payload)
-            elif msg_type == MessageType.PING_REQUEST:
-                await self._handle_ping_request()
-            elif msg_type == MessageType.BLUETOOTH_DEVICE_REQUEST:
-                await self._handle_bluetooth_device_request(payload)
-            elif msg_type == MessageType.BLUETOOTH_GATT_GET_SERVICES_REQUEST:
-                await self._handle_bluetooth_gatt_get_services_request(payload)
-            elif msg_type == MessageType.BLUETOOTH_GATT_READ_REQUEST:
-                await self._handle_bluetooth_gatt_read_request(payload)
-            elif msg_type == MessageType.BLUETOOTH_GATT_WRITE_REQUEST:
-                await self._handle_bluetooth_gatt_write_request(payload)
-            elif msg_type == MessageType.BLUETOOTH_GATT_NOTIFY_REQUEST:
-                await self._handle_bluetooth_gatt_notify_request(payload)
-            elif msg_type == MessageType.BLUETOOTH_GATT_READ_DESCRIPTOR_REQUEST:
-                await self._handle_bluetooth_gatt_read_descriptor_request(payload)
-            elif msg_type == MessageType.BLUETOOTH_GATT_WRITE_DESCRIPTOR_REQUEST:
-                await self._handle_bluetooth_gatt_write_descriptor_request(payload)
-            elif msg_type == MessageType.SUBSCRIBE_STATES_REQUEST:
-                await self._handle_subscribe_states_request(payload)
-            else:
-                logger.warning(
-                    f"Unknown message type {msg_type} from {self.client_address}"
-                )
+        handler = self._HANDLERS.get(msg_type)
+        if handler is None:
+            logger.warning(
+                "Unknown message type %s from %s", msg_type, self.client_address
+            )
+            return
 
+        try:
+            await handler(self, payload)
         except Exception as e:
             logger.error(
-                f"Error handling message type {msg_type} from "
-                f"{self.client_address}: {e}"
+                "Error handling message type %s from %s: %s",
+                msg_type,
+                self.client_address,
+                e,
             )
 
     async def _handle_hello_request(self, payload: bytes) -> None:
         """Handle HelloRequest message."""
         if self.state != ConnectionState.CONNECTING:
             logger.warning(
-                f"Unexpected HelloRequest from {self.client_address} in state "
-                f"{self.state}"
+                "Unexpected HelloRequest from %s in state %s",
+                self.client_address,
+                self.state,
             )
             return
 
@@ -191,45 +223,43 @@ class APIConnection:
             self.client_api_version_minor = request.api_version_minor
 
             logger.info(
-                f"Hello from {self.client_address}: '{request.client_info}' "
-                f"API v{request.api_version_major}.{request.api_version_minor}"
-            )
-
-            # Send HelloResponse
-            response = HelloResponse(
-                api_version_major=1,
-                api_version_minor=10,
-                server_info="ESPHome Python Bluetooth Proxy v0.1.0",
-                name="python-bluetooth-proxy",
+                "Hello from %s: '%s' API v%s.%s",
+                self.client_address,
+                request.client_info,
+                request.api_version_major,
+                request.api_version_minor,
             )
 
-            await self._send_message(
-                MessageType.HELLO_RESPONSE, self.encoder.encode_hello_response(response)
-            )
+            # Send the prebuilt HelloResponse frame
+            self.writer.write(_HELLO_RESPONSE_FRAME)
+            await self.writer.drain()
 
             # Update state - always wait for ConnectRequest regardless of password
             # This ensures proper protocol flow even when no password is required
-            self.state = ConnectionState.CONNECTED
+            self._set_state(ConnectionState.CONNECTED)
             logger.debug(
-                f"Client {self.client_address} connected, waiting for ConnectRequest"
+                "Client %s connected, waiting for ConnectRequest", self.client_address
             )
 
         except Exception as e:
-            logger.error(f"Error handling HelloRequest from {self.client_address}: {e}")
+            logger.error(
+                "Error handling HelloRequest from %s: %s", self.client_address, e
+            )
 
     async def _handle_connect_request(self, payload: bytes) -> None:
         """Handle ConnectRequest message."""
         if self.state == ConnectionState.AUTHENTICATED:
             # Already authenticated, ignore duplicate ConnectRequest
             logger.debug(
-                f"Ignoring duplicate ConnectRequest from {self.client_address} "
-                f"(already authenticated)"
+                "Ignoring duplicate ConnectRequest from %s (already authenticated)",
+                self.client_address,
             )
             return
         elif self.state != ConnectionState.CONNECTED:
             logger.warning(
-                f"Unexpected ConnectRequest from {self.client_address} "
-                f"in state {self.state}"
+                "Unexpected ConnectRequest from %s in state %s",
+                self.client_address,
+                self.state,
             )
             return
 
@@ -248,26 +278,30 @@ class APIConnection:
             )
 
             if password_valid:
-                self.state = ConnectionState.AUTHENTICATED
-                logger.info(f"Client {self.client_address} authenticated (no password)")
+                self._set_state(ConnectionState.AUTHENTICATED)
+                if self.on_authenticated:
+                    self.on_authenticated(self)
+                logger.info(
+                    "Client %s authenticated (no password)", self.client_address
+                )
                 logger.debug(
-                    f"Client {self.client_address} ready for "
-                    f"DeviceInfo/ListEntities requests"
+                    "Client %s ready for DeviceInfo/ListEntities requests",
+                    self.client_address,
                 )
             else:
                 logger.warning(
-                    f"Client {self.client_address} provided invalid password"
+                    "Client %s provided invalid password", self.client_address
                 )
                 await self.close()
 
         except Exception as e:
             logger.error(
-                f"Error handling ConnectRequest from {self.client_address}: {e}"
+                "Error handling ConnectRequest from %s: %s", self.client_address, e
             )
 
     async def _handle_disconnect_request(self, payload: bytes) -> None:
         """Handle DisconnectRequest message."""
-        logger.info(f"Client {self.client_address} requested disconnect")
+        logger.info("Client %s requested disconnect", self.client_address)
 
         try:
             # Send DisconnectResponse
@@ -278,62 +312,74 @@ class APIConnection:
 
         except Exception as e:
             logger.error(
-                f"Error handling DisconnectRequest from {self.client_address}: {e}"
+                "Error handling DisconnectRequest from %s: %s", self.client_address, e
             )
 
     async def _handle_device_info_request(self, payload: bytes) -> None:
         """Handle DeviceInfoRequest message."""
-        logger.info(f"Received DeviceInfoRequest from {self.client_address}")
+        logger.info("Received DeviceInfoRequest from %s", self.client_address)
 
         # Allow DeviceInfo requests in CONNECTED state if no password is required
         # This supports aioesphomeapi client flow: Hello → DeviceInfo (skip Connect)
         if self.state == ConnectionState.CONNECTED and self.password is None:
             logger.debug(
-                f"Allowing DeviceInfo request from {self.client_address} "
-                f"(no password required)"
+                "Allowing DeviceInfo request from %s (no password required)",
+                self.client_address,
             )
         elif self.state != ConnectionState.AUTHENTICATED:
             logger.warning(
-                f"DeviceInfoRequest from unauthenticated client "
-                f"{self.client_address} in state {self.state}"
+                "DeviceInfoRequest from unauthenticated client %s in state %s",
+                self.client_address,
+                self.state,
             )
             return
 
         try:
             # Get device info from provider (now async)
-            logger.debug(f"Getting device info from provider for {self.client_address}")
+            logger.debug(
+                "Getting device info from provider for %s", self.client_address
+            )
             device_info = await self.device_info_provider()
-            logger.debug(f"Got device info: {device_info}")
+            logger.debug("Got device info: %s", device_info)
 
-            # Encode the response
-            encoded_response = self.encoder.encode_device_info_response(device_info)
-            logger.debug(f"Encoded device info response: {len(encoded_response)} bytes")
+            # Encode the response, reusing the last encoding while it is unchanged
+            cached = APIConnection._device_info_cache
+            if cached is not None and cached[0] == device_info:
+                encoded_response = cached[1]
+            else:
+                encoded_response = self.encoder.encode_device_info_response(device_info)
+                APIConnection._device_info_cache = (device_info, encoded_response)
+            logger.debug(
+                "Encoded device info response: %s bytes", len(encoded_response)
+            )
 
             await self._send_message(
                 MessageType.DEVICE_INFO_RESPONSE,
                 encoded_response,
             )
 
-            logger.info(f"Sent device info response to {self.client_address}")
+            logger.info("Sent device info response to %s", self.client_address)
 
         except Exception as e:
             logger.error(
-                f"Error handling DeviceInfoRequest from {self.client_address}: {e}"
+                "Error handling DeviceInfoRequest from %s: %s", self.client_address, e
             )
             import traceback
 
             logger.error(traceback.format_exc())
 
-    async def _handle_ping_request(self) -> None:
-        """Handle PingRequest message."""
+    async def _handle_ping_request(self, payload: bytes) -> None:
+        """Handle PingRequest message (no fields, payload is ignored)."""
         try:
             # Empty PingResponse
-            logger.debug(f"Sending ping response to {self.client_address}")
+            logger.debug("Sending ping response to %s", self.client_address)
             await self._send_message(MessageType.PING_RESPONSE, b"")
-            logger.debug(f"Sent ping response to {self.client_address}")
+            logger.debug("Sent ping response to %s", self.client_address)
 
         except Exception as e:
-            logger.error(f"Error handling PingRequest from {self.client_address}: {e}")
+            logger.error(
+                "Error handling PingRequest from %s: %s", self.client_address, e
+            )
             import traceback
 
             logger.error(traceback.format_exc())
@@ -348,7 +394,7 @@ class APIConnection:
         try:
             # No need to decode the request as it has no fields
             logger.info(
-                f"Client {self.client_address} requested entity list (none to report)"
+                "Client %s requested entity list (none to report)", self.client_address
             )
 
             # Send list entities done response (no entities to report)
@@ -362,7 +408,7 @@ class APIConnection:
 
         except Exception as e:
             logger.error(
-                f"Error handling ListEntitiesRequest from {self.client_address}: {e}"
+                "Error handling ListEntitiesRequest from %s: %s", self.client_address, e
             )
             import traceback
 
@@ -381,7 +427,7 @@ class APIConnection:
             # Decode request (not used, but decode for validation)
             _ = self.decoder.decode_subscribe_states_request(payload)
 
-            logger.info(f"Client {self.client_address} subscribed to state updates")
+            logger.info("Client %s subscribed to state updates", self.client_address)
 
             # Mark connection as subscribed
             self.subscribed_to_states = True
@@ -390,11 +436,13 @@ class APIConnection:
             # For Bluetooth proxy, we only need to send scanner state
             await self._send_bluetooth_scanner_state()
 
-            logger.info(f"Sent initial state updates to {self.client_address}")
+            logger.info("Sent initial state updates to %s", self.client_address)
 
         except Exception as e:
             logger.error(
-                f"Error handling SubscribeStatesRequest from {self.client_address}: {e}"
+                "Error handling SubscribeStatesRequest from %s: %s",
+                self.client_address,
+                e,
             )
             import traceback
 
@@ -405,22 +453,24 @@ class APIConnection:
         try:
             request = self.decoder.decode_bluetooth_device_request(payload)
             logger.debug(
-                f"Bluetooth device request from {self.client_address}: "
-                f"address={request.address:012X} action={request.action}"
+                "Bluetooth device request from %s: address=%012X action=%s",
+                self.client_address,
+                request.address,
+                request.action,
             )
 
             # Forward to Bluetooth proxy if available
             if hasattr(self, "bluetooth_proxy") and self.bluetooth_proxy:
                 if request.action == 0:  # Connect
                     success = await self.bluetooth_proxy.connect_device(
-                        request.address, request.address_type
+                        request.address, request.address_type, self
                     )
                 elif request.action == 1:  # Disconnect
                     success = await self.bluetooth_proxy.disconnect_device(
                         request.address
                     )
                 else:
-                    logger.warning(f"Unknown device action: {request.action}")
+                    logger.warning("Unknown device action: %s", request.action)
                     success = False
 
                 # Send response (connection state will be sent separately)
@@ -440,15 +490,16 @@ class APIConnection:
                 logger.warning("No Bluetooth proxy available for device request")
 
         except Exception as e:
-            logger.error(f"Error handling Bluetooth device request: {e}")
+            logger.error("Error handling Bluetooth device request: %s", e)
 
     async def _handle_bluetooth_gatt_get_services_request(self, payload: bytes) -> None:
         """Handle BluetoothGATTGetServicesRequest message."""
         try:
             request = self.decoder.decode_bluetooth_gatt_get_services_request(payload)
             logger.debug(
-                f"GATT get services request from {self.client_address}: "
-                f"address={request.address:012X}"
+                "GATT get services request from %s: address=%012X",
+                self.client_address,
+                request.address,
             )
 
             # Forward to Bluetooth proxy if available
@@ -481,7 +532,7 @@ class APIConnection:
                         )
 
                     except Exception as e:
-                        logger.error(f"Service discovery failed: {e}")
+                        logger.error("Service discovery failed: %s", e)
                         # Send empty response on error
                         response = BluetoothGATTGetServicesResponse(
                             address=request.address, services=[]
@@ -495,20 +546,22 @@ class APIConnection:
                             MessageType.BLUETOOTH_GATT_GET_SERVICES_RESPONSE, payload
                         )
                 else:
-                    logger.warning(f"Device {request.address:012X} not connected")
+                    logger.warning("Device %012X not connected", request.address)
             else:
                 logger.warning("No Bluetooth proxy available for GATT services request")
 
         except Exception as e:
-            logger.error(f"Error handling GATT get services request: {e}")
+            logger.error("Error handling GATT get services request: %s", e)
 
     async def _handle_bluetooth_gatt_read_request(self, payload: bytes) -> None:
         """Handle BluetoothGATTReadRequest message."""
         try:
             request = self.decoder.decode_bluetooth_gatt_read_request(payload)
             logger.debug(
-                f"GATT read request from {self.client_address}: "
-                f"address={request.address:012X} handle={request.handle}"
+                "GATT read request from %s: address=%012X handle=%s",
+                self.client_address,
+                request.address,
+                request.handle,
             )
 
             # Forward to GATT operations handler if available
@@ -520,16 +573,20 @@ class APIConnection:
                 logger.warning("No GATT handler available for read request")
 
         except Exception as e:
-            logger.error(f"Error handling GATT read request: {e}")
+            logger.error("Error handling GATT read request: %s", e)
 
     async def _handle_bluetooth_gatt_write_request(self, payload: bytes) -> None:
         """Handle BluetoothGATTWriteRequest message."""
         try:
             request = self.decoder.decode_bluetooth_gatt_write_request(payload)
             logger.debug(
-                f"GATT write request from {self.client_address}: "
-                f"address={request.address:012X} handle={request.handle} "
-                f"data={len(request.data)} bytes response={request.response}"
+                "GATT write request from %s: address=%012X handle=%s "
+                "data=%s bytes response=%s",
+                self.client_address,
+                request.address,
+                request.handle,
+                len(request.data),
+                request.response,
             )
 
             # Forward to GATT operations handler if available
@@ -541,16 +598,18 @@ class APIConnection:
                 logger.warning("No GATT handler available for write request")
 
         except Exception as e:
-            logger.error(f"Error handling GATT write request: {e}")
+            logger.error("Error handling GATT write request: %s", e)
 
     async def _handle_bluetooth_gatt_notify_request(self, payload: bytes) -> None:
         """Handle BluetoothGATTNotifyRequest message."""
         try:
             request = self.decoder.decode_bluetooth_gatt_notify_request(payload)
             logger.debug(
-                f"GATT notify request from {self.client_address}: "
-                f"address={request.address:012X} handle={request.handle} "
-                f"enable={request.enable}"
+                "GATT notify request from %s: address=%012X handle=%s enable=%s",
+                self.client_address,
+                request.address,
+                request.handle,
+                request.enable,
             )
 
             # Forward to GATT operations handler if available
@@ -562,7 +621,7 @@ class APIConnection:
                 logger.warning("No GATT handler available for notify request")
 
         except Exception as e:
-            logger.error(f"Error handling GATT notify request: {e}")
+            logger.error("Error handling GATT notify request: %s", e)
 
     async def _handle_bluetooth_gatt_read_descriptor_request(
         self, payload: bytes
@@ -573,8 +632,10 @@ class APIConnection:
                 payload
             )
             logger.debug(
-                f"GATT read descriptor request from {self.client_address}: "
-                f"address={request.address:012X} handle={request.handle}"
+                "GATT read descriptor request from %s: address=%012X handle=%s",
+                self.client_address,
+                request.address,
+                request.handle,
             )
 
             # Forward to GATT operations handler if available
@@ -586,7 +647,7 @@ class APIConnection:
                 logger.warning("No GATT handler available for read descriptor request")
 
         except Exception as e:
-            logger.error(f"Error handling GATT read descriptor request: {e}")
+            logger.error("Error handling GATT read descriptor request: %s", e)
 
     async def _handle_bluetooth_gatt_write_descriptor_request(
         self, payload: bytes
@@ -597,9 +658,12 @@ class APIConnection:
                 payload
             )
             logger.debug(
-                f"GATT write descriptor request from {self.client_address}: "
-                f"address={request.address:012X} handle={request.handle} "
-                f"data={len(request.data)} bytes"
+                "GATT write descriptor request from %s: address=%012X handle=%s "
+                "data=%s bytes",
+                self.client_address,
+                request.address,
+                request.handle,
+                len(request.data),
             )
 
             # Forward to GATT operations handler if available
@@ -611,35 +675,61 @@ class APIConnection:
                 logger.warning("No GATT handler available for write descriptor request")
 
         except Exception as e:
-            logger.error(f"Error handling GATT write descriptor request: {e}")
+            logger.error("Error handling GATT write descriptor request: %s", e)
 
     async def _send_message(self, msg_type: int, payload: bytes) -> None:
         """Send a message to the client."""
         try:
-            frame = create_message_frame(msg_type, payload)
-            self.writer.write(frame)
+            # Header and payload go out in one send without concatenating them
+            self.writer.writelines(
+                (create_frame_header(msg_type, len(payload)), payload)
+            )
             await self.writer.drain()
 
             logger.debug(
-                f"Sent message type {msg_type} to {self.client_address} "
-                f"({len(payload)} bytes payload)"
+                "Sent message type %s to %s (%s bytes payload)",
+                msg_type,
+                self.client_address,
+                len(payload),
             )
 
         except Exception as e:
-            logger.error(f"Error sending message to {self.client_address}: {e}")
+            logger.error("Error sending message to %s: %s", self.client_address, e)
             raise
 
     async def send_message(self, msg_type: int, payload: bytes) -> None:
         """Public method to send a message to the client."""
         if self.state != ConnectionState.AUTHENTICATED:
             logger.warning(
-                f"Attempt to send message to unauthenticated client "
-                f"{self.client_address}"
+                "Attempt to send message to unauthenticated client %s",
+                self.client_address,
             )
             return
 
         await self._send_message(msg_type, payload)
 
+    async def send_framed(self, framed: bytes) -> None:
+        """Send an already framed message to the client.
+
+        Used for broadcasts, where the frame is built once for all connections.
+
+        Args:
+            framed: Complete message frame from create_message_frame
+        """
+        if self.state != ConnectionState.AUTHENTICATED:
+            logger.warning(
+                "Attempt to send message to unauthenticated client %s",
+                self.client_address,
+            )
+            return
+
+        try:
+            self.writer.write(framed)
+            await self.writer.drain()
+        except Exception as e:
+            logger.error("Error sending message to %s: %s", self.client_address, e)
+            raise
+
     def is_authenticated(self) -> bool:
         """Check if the connection is authenticated."""
         return self.state == ConnectionState.AUTHENTICATED
@@ -648,57 +738,46 @@ class APIConnection:
         """Check if the connection is still active."""
         return not self.writer.is_closing()
 
-    async def send_bluetooth_le_advertisements(self, advertisements: list) -> None:
+    async def send_bluetooth_le_advertisements(self, frame: list) -> None:
         """Send batch of BLE advertisements to client.
 
         Args:
-            advertisements: List of BLEAdvertisement objects
+            frame: Serialized BluetoothLERawAdvertisementsResponse frame chunks,
+                as produced by AdvertisementBatcher.serialize_batch
         """
         if self.state not in [ConnectionState.AUTHENTICATED, ConnectionState.CONNECTED]:
             logger.debug(
-                f"Skipping BLE advertisements to {self.client_address} "
-                f"(state: {self.state})"
+                "Skipping BLE advertisements to %s (state: %s)",
+                self.client_address,
+                self.state,
             )
             return
 
         try:
-            # Convert BLEAdvertisement objects to protocol messages
-            protocol_advertisements = []
-            for adv in advertisements:
-                protocol_adv = BluetoothLEAdvertisementResponse(
-                    address=adv.address,
-                    rssi=adv.rssi,
-                    address_type=adv.address_type,
-                    data=adv.data,
-                )
-                protocol_advertisements.append(protocol_adv)
-
-            # Create batch response message
-            batch_response = BluetoothLERawAdvertisementsResponse(
-                advertisements=protocol_advertisements
-            )
-
-            # Encode and send
-            payload = self.encoder.encode_bluetooth_le_raw_advertisements_response(
-                batch_response
-            )
-            frame = create_message_frame(
-                MessageType.BLUETOOTH_LE_RAW_ADVERTISEMENTS_RESPONSE, payload
-            )
-
-            self.writer.write(frame)
+            self.writer.writelines(frame)
             await self.writer.drain()
 
             logger.debug(
-                f"Sent {len(advertisements)} BLE advertisements to "
-                f"{self.client_address}"
+                "Sent %s BLE advertisements to %s", len(frame) - 1, self.client_address
             )
 
         except Exception as e:
             logger.error(
-                f"Error sending BLE advertisements to {self.client_address}: {e}"
+                "Error sending BLE advertisements to %s: %s", self.client_address, e
             )
 
+    def _set_state(self, state: ConnectionState) -> None:
+        """Change connection state, reporting Bluetooth subscription changes.
+
+        Args:
+            state: New connection state
+        """
+        was_subscribed = self.is_bluetooth_subscribed()
+        self.state = state
+        subscribed = self.is_bluetooth_subscribed()
+        if subscribed != was_subscribed and self.on_bluetooth_subscription_changed:
+            self.on_bluetooth_subscription_changed(self, subscribed)
+
     def is_bluetooth_subscribed(self) -> bool:
         """Check if connection is subscribed to Bluetooth events.
 
@@ -715,9 +794,9 @@ class APIConnection:
             try:
                 self.writer.close()
                 await self.writer.wait_closed()
-                logger.info(f"Connection {self.client_address} closed")
+                logger.info("Connection %s closed", self.client_address)
             except Exception as e:
-                logger.error(f"Error closing connection {self.client_address}: {e}")
+                logger.error("Error closing connection %s: %s", self.client_address, e)
 
     async def _send_bluetooth_scanner_state(self) -> None:
         """Send current Bluetooth scanner state to client.
@@ -745,10 +824,10 @@ class APIConnection:
                 MessageType.BLUETOOTH_SCANNER_STATE_RESPONSE, payload
             )
 
-            logger.debug(f"Sent Bluetooth scanner state to {self.client_address}")
+            logger.debug("Sent Bluetooth scanner state to %s", self.client_address)
 
         except Exception as e:
-            logger.error(f"Error sending Bluetooth scanner state: {e}")
+            logger.error("Error sending Bluetooth scanner state: %s", e)
 
     def __str__(self) -> str:
         """String representation of the connection."""
@@ -757,3 +836,29 @@ class APIConnection:
             f"{self.state.name}, "
             f"{self.client_info})"
         )
+
+    # Message type -> handler, so _handle_message dispatches with one lookup
+    _HANDLERS: Dict[int, Callable[["APIConnection", bytes], Awaitable[None]]] = {
+        MessageType.HELLO_REQUEST: _handle_hello_request,
+        MessageType.CONNECT_REQUEST: _handle_connect_request,
+        MessageType.DISCONNECT_REQUEST: _handle_disconnect_request,
+        MessageType.DEVICE_INFO_REQUEST: _handle_device_info_request,
+        MessageType.LIST_ENTITIES_REQUEST: _handle_list_entities_request,
+        MessageType.PING_REQUEST: _handle_ping_request,
+        MessageType.BLUETOOTH_DEVICE_REQUEST: _handle_bluetooth_device_request,
+        MessageType.BLUETOOTH_GATT_GET_SERVICES_REQUEST: (
+            _handle_bluetooth_gatt_get_services_request
+        ),
+        MessageType.BLUETOOTH_GATT_READ_REQUEST: _handle_bluetooth_gatt_read_request,
+        MessageType.BLUETOOTH_GATT_WRITE_REQUEST: _handle_bluetooth_gatt_write_request,
+        MessageType.BLUETOOTH_GATT_NOTIFY_REQUEST: (
+            _handle_bluetooth_gatt_notify_request
+        ),
+        MessageType.BLUETOOTH_GATT_READ_DESCRIPTOR_REQUEST: (
+            _handle_bluetooth_gatt_read_descriptor_request
+        ),
+        MessageType.BLUETOOTH_GATT_WRITE_DESCRIPTOR_REQUEST: (
+            _handle_bluetooth_gatt_write_descriptor_request
+        ),
+        MessageType.SUBSCRIBE_STATES_REQUEST: _handle_subscribe_states_request,
+    }
@@ -221,8 +221,8 @@ class GATTOperationHandler:
             if enable:
                 # Create callback that forwards notifications
                 def notification_callback(data: bytes):
-                    # Schedule the async notification forwarding
-                    asyncio.create_task(
+                    # Forward asynchronously; cancelled if the device disconnects
+                    connection.create_task(
                         self.handle_notification_data(address, handle, data)
                     )
 
@@ -315,7 +315,7 @@ class GATTOperationHandler:
 
             # Send to all subscribed API connections
             if self.bluetooth_proxy and self.bluetooth_proxy.api_server:
-                for connection in self.bluetooth_proxy.api_server.connections:
+                for connection in tuple(self.bluetooth_proxy.api_server.connections):
                     if connection.is_authenticated():
                         await connection.send_message(
                             MessageType.BLUETOOTH_GATT_READ_RESPONSE, payload
@@ -343,7 +343,7 @@ class GATTOperationHandler:
 
             # Send to all subscribed API connections
             if self.bluetooth_proxy and self.bluetooth_proxy.api_server:
-                for connection in self.bluetooth_proxy.api_server.connections:
+                for connection in tuple(self.bluetooth_proxy.api_server.connections):
                     if connection.is_authenticated():
                         await connection.send_message(
                             MessageType.BLUETOOTH_GATT_WRITE_RESPONSE, payload
@@ -373,7 +373,7 @@ class GATTOperationHandler:
 
             # Send to all subscribed API connections
             if self.bluetooth_proxy and self.bluetooth_proxy.api_server:
-                for connection in self.bluetooth_proxy.api_server.connections:
+                for connection in tuple(self.bluetooth_proxy.api_server.connections):
                     if connection.is_authenticated():
                         await connection.send_message(
                             MessageType.BLUETOOTH_GATT_NOTIFY_DATA_RESPONSE, payload
@@ -403,7 +403,7 @@ class GATTOperationHandler:
 
             # Send to all subscribed API connections
             if self.bluetooth_proxy and self.bluetooth_proxy.api_server:
-                for connection in self.bluetooth_proxy.api_server.connections:
+                for connection in tuple(self.bluetooth_proxy.api_server.connections):
                     if connection.is_authenticated():
                         await connection.send_message(
                             MessageType.BLUETOOTH_GATT_READ_RESPONSE, payload
@@ -4,9 +4,11 @@ This module implements the ESPHome API protocol message encoding/decoding
 and provides the core message types needed for the 4-step handshake.
 """
 
+import functools
 import logging
 from dataclasses import dataclass
 from enum import IntEnum
+from typing import Iterable
 
 logger = logging.getLogger(__name__)
 
@@ -307,6 +309,12 @@ class ProtocolError(Exception):
     pass
 
 
+class IncompleteFrameError(ProtocolError):
+    """Data ended before a complete varint or frame; more bytes are needed."""
+
+    pass
+
+
 def encode_varint(value: int) -> bytes:
     """Encode integer as variable-length integer."""
     result = bytearray()
@@ -317,6 +325,22 @@ def encode_varint(value: int) -> bytes:
     return bytes(result)
 
 
+@functools.lru_cache(maxsize=4096)
+def _encode_varint_field(tag: int, value: int) -> bytes:
+    """Encode a tag byte followed by a varint value.
+
+    Cached, since advertisement addresses, RSSIs and lengths keep repeating.
+
+    Args:
+        tag: Field tag byte (field number and wire type)
+        value: Non-negative integer value
+
+    Returns:
+        bytes: Encoded tag and value
+    """
+    return bytes((tag,)) + encode_varint(value)
+
+
 def decode_varint(data: bytes, offset: int = 0) -> tuple[int, int]:
     """Decode variable-length integer from bytes.
 
@@ -337,7 +361,7 @@ def decode_varint(data: bytes, offset: int = 0) -> tuple[int, int]:
         if shift >= 64:
             raise ProtocolError("VarInt too long")
     else:
-        raise ProtocolError("Incomplete VarInt")
+        raise IncompleteFrameError("Incomplete VarInt")
 
     return result, pos - offset
 
@@ -506,16 +530,53 @@ class MessageEncoder:
         self, msg: BluetoothLERawAdvertisementsResponse
     ) -> bytes:
         """Encode BluetoothLERawAdvertisementsResponse message."""
-        data = bytearray()
+        return b"".join(self.encode_bluetooth_le_advertisements(msg.advertisements))
 
-        # Field 1: advertisements (repeated BluetoothLEAdvertisementResponse)
-        for advertisement in msg.advertisements:
-            data.extend(b"\x0a")  # Field 1, length-delimited
-            adv_data = self.encode_bluetooth_le_advertisement_response(advertisement)
-            data.extend(encode_varint(len(adv_data)))
-            data.extend(adv_data)
+    def encode_bluetooth_le_advertisements(
+        self, advertisements: Iterable[BluetoothLEAdvertisementResponse]
+    ) -> list[bytes]:
+        """Encode advertisements as repeated field 1 entries, in one pass.
 
-        return bytes(data)
+        Each entry is built with a single join from cached field encodings, with
+        its length summed up front rather than measured after encoding.
+
+        Args:
+            advertisements: Advertisements to encode; anything with address,
+                rssi, address_type and data attributes works
+
+        Returns:
+            list[bytes]: One chunk per advertisement, ready to be joined or
+                written out after a frame header
+        """
+        field = _encode_varint_field
+        chunks: list[bytes] = []
+        append = chunks.append
+        for advertisement in advertisements:
+            address = field(0x08, advertisement.address)  # Field 1, uint64
+            # Field 2, int32; negative values are sent as their uint32 encoding
+            rssi = field(0x10, advertisement.rssi & 0xFFFFFFFF)
+            address_type = field(0x18, advertisement.address_type)  # Field 3
+            adv_data = advertisement.data
+            size = len(address) + len(rssi) + len(address_type)
+            if adv_data:
+                # Field 4: data (bytes)
+                data_header = field(0x22, len(adv_data))
+                size += len(data_header) + len(adv_data)
+                append(
+                    b"".join(
+                        (
+                            field(0x0A, size),
+                            address,
+                            rssi,
+                            address_type,
+                            data_header,
+                            adv_data,
+                        )
+                    )
+                )
+            else:
+                append(b"".join((field(0x0A, size), address, rssi, address_type)))
+        return chunks
 
     def encode_bluetooth_device_connection_response(
         self, msg: BluetoothDeviceConnectionResponse
@@ -1019,6 +1080,11 @@ class MessageDecoder:
         return msg
 
 
+def create_frame_header(msg_type: int, payload_size: int) -> bytes:
+    """Create ESPHome message frame header for a payload of the given size."""
+    return b"\x00" + encode_varint(payload_size) + encode_varint(msg_type)
+
+
 def create_message_frame(msg_type: int, payload: bytes) -> bytes:
     """Create ESPHome message frame with header."""
     # ESPHome frame format: [0x00][VarInt: Message Size][VarInt: Message Type][Payload]
@@ -1030,26 +1096,53 @@ def create_message_frame(msg_type: int, payload: bytes) -> bytes:
     return bytes(frame)
 
 
-def parse_message_frame(data: bytes) -> tuple[int, bytes, int]:
-    """Parse ESPHome message frame.
+def parse_frame_header(data: bytes, start: int = 0) -> tuple[int, int, int]:
+    """Parse the header of an ESPHome message frame.
+
+    Both varints almost always fit in one byte, which is handled without
+    calling decode_varint.
+
+    Args:
+        data: Buffer holding the frame
+        start: Offset of the frame within data
 
     Returns:
-        tuple[int, bytes, int]: (message_type, payload, total_frame_size)
+        tuple[int, int, int]: (message_type, payload_size, header_size)
     """
-    if len(data) < 1 or data[0] != 0x00:
+    if len(data) <= start or data[start] != 0x00:
         raise ProtocolError("Invalid frame start marker")
 
-    offset = 1
-    payload_size, size_bytes = decode_varint(data, offset)
-    offset += size_bytes
+    if len(data) >= start + 3:
+        payload_size = data[start + 1]
+        msg_type = data[start + 2]
+        if payload_size < 0x80 and msg_type < 0x80:
+            return msg_type, payload_size, 3
+
+    payload_size, size_bytes = decode_varint(data, start + 1)
+    msg_type, type_bytes = decode_varint(data, start + 1 + size_bytes)
+    return msg_type, payload_size, 1 + size_bytes + type_bytes
 
-    msg_type, type_bytes = decode_varint(data, offset)
-    offset += type_bytes
+
+def parse_message_frame(data: bytes, start: int = 0) -> tuple[int, bytes, int]:
+    """Parse ESPHome message frame.
+
+    The buffer is read in place; only the payload is copied out.
+
+    Args:
+        data: Buffer holding the frame, e.g. a receive bytearray
+        start: Offset of the frame within data, so a receive buffer can be
+            walked frame by frame without slicing it
+
+    Returns:
+        tuple[int, bytes, int]: (message_type, payload, total_frame_size)
+    """
+    msg_type, payload_size, header_size = parse_frame_header(data, start)
+    offset = start + header_size
 
     if offset + payload_size > len(data):
-        raise ProtocolError("Incomplete message frame")
+        raise IncompleteFrameError("Incomplete message frame")
 
-    payload = data[offset : offset + payload_size]
-    total_size = offset + payload_size
+    payload = bytes(data[offset : offset + payload_size])
+    total_size = offset + payload_size - start
 
     return msg_type, payload, total_size
@@ -17,6 +17,7 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from esphome_bluetooth_proxy.api_server import ESPHomeAPIServer
 from esphome_bluetooth_proxy.protocol import (
+    IncompleteFrameError,
     MessageType,
     create_message_frame,
     parse_message_frame,
@@ -111,22 +112,23 @@ class TestClient:
 
                 buffer.extend(data)
 
-                # Process complete messages
-                while len(buffer) >= 3:
+                # Process complete messages, parsing the buffer in place
+                offset = 0
+                while len(buffer) - offset >= 3:
                     try:
                         msg_type, payload, frame_size = parse_message_frame(
-                            bytes(buffer)
+                            buffer, offset
                         )
-                        buffer = buffer[frame_size:]
+                        offset += frame_size
 
                         await self._handle_message(msg_type, payload)
 
+                    except IncompleteFrameError:
+                        break
                     except Exception as e:
-                        if "Incomplete message frame" in str(e):
-                            break
-                        else:
-                            logger.error(f"Error parsing message: {e}")
-                            return
+                        logger.error(f"Error parsing message: {e}")
+                        return
+                del buffer[:offset]
 
             except asyncio.TimeoutError:
                 continue
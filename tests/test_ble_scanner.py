@@ -0,0 +1,59 @@
+"""Tests for BLE advertisement coalescing in BLEScanner."""
+
+import asyncio
+
+from bleak.backends.device import BLEDevice
+from bleak.backends.scanner import AdvertisementData
+
+from esphome_bluetooth_proxy.ble_scanner import COALESCE_INTERVAL_S, BLEScanner
+
+
+def _advertisement(address, payload, rssi=-60):
+    device = BLEDevice(address, None, None)
+    data = AdvertisementData(
+        local_name=None,
+        manufacturer_data={0x004C: payload},
+        service_data={},
+        service_uuids=[],
+        tx_power=None,
+        rssi=rssi,
+        platform_data=(),
+    )
+    return device, data
+
+
+async def test_burst_from_one_device_is_coalesced():
+    """Test that a burst from one MAC yields one advertisement, the latest."""
+    batches = []
+    scanner = BLEScanner(callback=None, batch_callback=batches.append)
+
+    for i in range(5):
+        scanner._on_advertisement(
+            *_advertisement("AA:BB:CC:DD:EE:01", bytes([i]), -60 - i)
+        )
+    assert batches == []
+
+    await asyncio.sleep(COALESCE_INTERVAL_S * 2)
+
+    assert len(batches) == 1
+    (advertisement,) = batches[0]
+    assert advertisement.address == 0xAABBCCDDEE01
+    assert advertisement.data == b"\xff\x4c\x00\x04"
+    assert advertisement.rssi == -64
+
+
+async def test_different_devices_are_not_merged():
+    """Test that advertisements from different MACs are all delivered."""
+    received = []
+    scanner = BLEScanner(callback=received.append)
+
+    scanner._on_advertisement(*_advertisement("AA:BB:CC:DD:EE:01", b"\x01"))
+    scanner._on_advertisement(*_advertisement("AA:BB:CC:DD:EE:02", b"\x02"))
+    scanner._on_advertisement(*_advertisement("AA:BB:CC:DD:EE:01", b"\x03"))
+
+    await asyncio.sleep(COALESCE_INTERVAL_S * 2)
+
+    assert [(a.address, a.data) for a in received] == [
+        (0xAABBCCDDEE01, b"\xff\x4c\x00\x03"),
+        (0xAABBCCDDEE02, b"\xff\x4c\x00\x02"),
+    ]
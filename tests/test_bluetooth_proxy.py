@@ -0,0 +1,105 @@
+"""Tests for BluetoothProxy connection slot handling."""
+
+import asyncio
+
+import pytest
+
+from esphome_bluetooth_proxy import bluetooth_proxy
+from esphome_bluetooth_proxy.ble_connection import BLEConnection
+from esphome_bluetooth_proxy.protocol import MessageType
+
+FIRST = 0x112233445501
+SECOND = 0x112233445502
+
+
+class _APIConnection:
+    """Records the messages the proxy sends back."""
+
+    def __init__(self):
+        self.sent = []
+
+    async def send_message(self, msg_type, payload):
+        self.sent.append(msg_type)
+
+
+@pytest.fixture
+def proxy(monkeypatch):
+    """Proxy with a single connection slot whose connects do nothing."""
+
+    async def connect(self):
+        return True
+
+    monkeypatch.setattr(BLEConnection, "connect", connect)
+    monkeypatch.setattr(bluetooth_proxy, "CONNECT_SLOT_TIMEOUT_S", 0.05)
+
+    proxy = bluetooth_proxy.BluetoothProxy(None, max_connections=1)
+    proxy._initialize_connection_pool()
+    return proxy
+
+
+async def test_connect_fails_when_no_slot_frees_up(proxy):
+    """Test that a queued connect times out and reports the failure."""
+    api_connection = _APIConnection()
+    assert await proxy.connect_device(FIRST, 0, api_connection)
+
+    # Returns at once; the wait for a slot runs in the background
+    assert await proxy.connect_device(SECOND, 0, api_connection)
+    pending = proxy._pending_connects[SECOND]
+    await pending
+
+    assert SECOND not in proxy.connections
+    assert not proxy._pending_connects
+    assert api_connection.sent == [MessageType.BLUETOOTH_DEVICE_CONNECTION_RESPONSE]
+    assert proxy.get_free_connections() == 0
+
+
+async def test_slot_is_handed_over_on_disconnect(proxy):
+    """Test that a disconnect passes its slot to the queued connect."""
+    api_connection = _APIConnection()
+    assert await proxy.connect_device(FIRST, 0, api_connection)
+    slot = proxy.connections[FIRST]
+
+    assert await proxy.connect_device(SECOND, 0, api_connection)
+    pending = proxy._pending_connects[SECOND]
+    await asyncio.sleep(0)
+
+    await proxy.on_device_connected(FIRST, False)
+    await pending
+
+    assert proxy.connections == {SECOND: slot}
+    assert slot.address == SECOND
+    assert api_connection.sent == []
+
+
+async def test_cancelled_waiter_does_not_leak_the_slot(proxy):
+    """Test that a slot handed to a waiter cancelled meanwhile is returned."""
+    api_connection = _APIConnection()
+    assert await proxy.connect_device(FIRST, 0, api_connection)
+    assert await proxy.connect_device(SECOND, 0, api_connection)
+    pending = proxy._pending_connects[SECOND]
+    await asyncio.sleep(0)
+
+    # The slot goes to the waiter, then the connect is cancelled before the
+    # waiting task gets to run
+    await proxy.on_device_connected(FIRST, False)
+    assert await proxy.disconnect_device(SECOND)
+    with pytest.raises(asyncio.CancelledError):
+        await pending
+
+    assert proxy.connections == {}
+    assert proxy.get_free_connections() == 1
+
+
+async def test_duplicate_connect_while_pending_is_refused(proxy):
+    """Test that a second connect for a queued address is refused."""
+    api_connection = _APIConnection()
+    assert await proxy.connect_device(FIRST, 0, api_connection)
+    assert await proxy.connect_device(SECOND, 0, api_connection)
+    pending = proxy._pending_connects[SECOND]
+
+    assert not await proxy.connect_device(SECOND, 0, api_connection)
+    assert proxy._pending_connects == {SECOND: pending}
+
+    await proxy.on_device_connected(FIRST, False)
+    await pending
+    assert list(proxy.connections) == [SECOND]
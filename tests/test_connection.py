@@ -0,0 +1,63 @@
+"""Tests for APIConnection's send path."""
+
+import asyncio
+
+import pytest
+
+from esphome_bluetooth_proxy.connection import APIConnection, ConnectionState
+from esphome_bluetooth_proxy.protocol import create_message_frame
+
+
+class _Writer:
+    """Stream writer that records what is written by the time drain() runs."""
+
+    def __init__(self, drain_error=None):
+        self.buffer = bytearray()
+        self.drained = []
+        self.drain_error = drain_error
+
+    def get_extra_info(self, name):
+        return None
+
+    def write(self, data):
+        self.buffer += data
+
+    def writelines(self, chunks):
+        for chunk in chunks:
+            self.buffer += chunk
+
+    async def drain(self):
+        if self.drain_error is not None:
+            raise self.drain_error
+        self.drained.append(bytes(self.buffer))
+
+
+def _connection(writer):
+    connection = APIConnection(asyncio.StreamReader(), writer, lambda: None)
+    connection.state = ConnectionState.AUTHENTICATED
+    return connection
+
+
+async def test_frames_are_written_before_drain():
+    """Test that each send's frame is in the writer when it drains."""
+    writer = _Writer()
+    connection = _connection(writer)
+    first = create_message_frame(7, b"abc")
+    second = create_message_frame(8, b"")
+
+    await connection.send_message(7, b"abc")
+    await connection.send_framed(second)
+    await connection.send_bluetooth_le_advertisements([first[:2], first[2:]])
+
+    assert writer.drained == [first, first + second, first + second + first]
+
+
+async def test_send_errors_reach_the_caller():
+    """Test that a failed send raises instead of being reported as sent."""
+    writer = _Writer(ConnectionResetError("Connection lost"))
+    connection = _connection(writer)
+
+    with pytest.raises(ConnectionResetError):
+        await connection.send_message(7, b"abc")
+    with pytest.raises(ConnectionResetError):
+        await connection.send_framed(create_message_frame(8, b""))
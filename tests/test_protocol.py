@@ -0,0 +1,91 @@
+"""Tests for ESPHome frame parsing."""
+
+import asyncio
+
+import pytest
+
+from esphome_bluetooth_proxy.connection import APIConnection
+from esphome_bluetooth_proxy.protocol import (
+    IncompleteFrameError,
+    ProtocolError,
+    create_message_frame,
+    decode_varint,
+    parse_frame_header,
+    parse_message_frame,
+)
+
+# Both varints take two bytes: size 300 -> AC 02, type 200 -> C8 01
+MULTI_BYTE_TYPE = 200
+MULTI_BYTE_PAYLOAD = bytes(range(256)) + bytes(44)
+
+
+class _Writer:
+    """Stand-in stream writer; _read_frame never writes."""
+
+    def get_extra_info(self, name):
+        return None
+
+
+def test_multi_byte_header():
+    """Test that size and type varints of 128 and up are parsed."""
+    frame = create_message_frame(MULTI_BYTE_TYPE, MULTI_BYTE_PAYLOAD)
+    assert frame[:5] == b"\x00\xac\x02\xc8\x01"
+
+    assert parse_frame_header(frame) == (MULTI_BYTE_TYPE, 300, 5)
+    assert parse_message_frame(frame) == (
+        MULTI_BYTE_TYPE,
+        MULTI_BYTE_PAYLOAD,
+        len(frame),
+    )
+
+
+@pytest.mark.parametrize("length", [2, 3, 4])
+def test_partial_header_is_incomplete(length):
+    """Test that a header cut short raises IncompleteFrameError."""
+    frame = create_message_frame(MULTI_BYTE_TYPE, MULTI_BYTE_PAYLOAD)
+    with pytest.raises(IncompleteFrameError):
+        parse_frame_header(frame[:length])
+
+
+def test_partial_payload_is_incomplete():
+    """Test that a frame missing payload bytes raises IncompleteFrameError."""
+    frame = create_message_frame(MULTI_BYTE_TYPE, MULTI_BYTE_PAYLOAD)
+    with pytest.raises(IncompleteFrameError):
+        parse_message_frame(frame[:-1])
+
+
+def test_bad_input_is_not_incomplete():
+    """Test that malformed data raises ProtocolError, not IncompleteFrameError."""
+    with pytest.raises(ProtocolError) as excinfo:
+        parse_frame_header(b"\x01\x00\x00")
+    assert not isinstance(excinfo.value, IncompleteFrameError)
+
+    with pytest.raises(ProtocolError) as excinfo:
+        decode_varint(b"\xff" * 10)
+    assert not isinstance(excinfo.value, IncompleteFrameError)
+
+
+async def test_read_frame_multi_byte_header_in_pieces():
+    """Test that _read_frame waits for a multi-byte header sent byte by byte."""
+    frame = create_message_frame(MULTI_BYTE_TYPE, MULTI_BYTE_PAYLOAD)
+    reader = asyncio.StreamReader()
+    connection = APIConnection(reader, _Writer(), lambda: None)
+
+    read = asyncio.create_task(connection._read_frame())
+    for i in range(6):
+        reader.feed_data(frame[i : i + 1])
+        await asyncio.sleep(0)
+        assert not read.done()
+    reader.feed_data(frame[6:])
+
+    assert await read == (MULTI_BYTE_TYPE, MULTI_BYTE_PAYLOAD)
+
+
+async def test_read_frame_single_byte_header():
+    """Test that _read_frame reads back-to-back small frames."""
+    reader = asyncio.StreamReader()
+    connection = APIConnection(reader, _Writer(), lambda: None)
+    reader.feed_data(create_message_frame(7, b"") + create_message_frame(8, b"ab"))
+
+    assert await connection._read_frame() == (7, b"")
+    assert await connection._read_frame() == (8, b"ab")